@@ -11,13 +11,64 @@ import hashlib
 import secrets
 import os
 
-# Add theme directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '.sys', 'theme'))
-from theme import Colors, Icons, log_success, log_error, log_warn, log_info, log_header
-
-def calculate_hash(content: str) -> str:
-    """Calculate SHA256 hash of content."""
-    return hashlib.sha256(content.encode()).hexdigest()
+# Add sys/theme to path for central theming (after all stdlib imports)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'sys', 'theme'))
+from theme import Colors, Icons, log_success, log_error, log_info, log_header, format_header, format_warn
+
+# Menus only depend on the theme, so they are rendered once at import time
+MENU = (
+    format_header(f"\n{Icons.ROCKET}  Skip File Hash Generator") + "\n"
+    f"\n{Colors.TEXT}Select a skip file to customize:{Colors.NC}\n\n"
+    f"  {Colors.SAPPHIRE}1.{Colors.NC} {Colors.TEXT}.skip.all{Colors.NC}           {Colors.SUBTEXT}(skip all workflows){Colors.NC}\n"
+    f"  {Colors.SAPPHIRE}2.{Colors.NC} {Colors.TEXT}.skip.claude{Colors.NC}        {Colors.SUBTEXT}(skip @claude comments){Colors.NC}\n"
+    f"  {Colors.SAPPHIRE}3.{Colors.NC} {Colors.TEXT}.skip.claude-review{Colors.NC}  {Colors.SUBTEXT}(skip automatic reviews){Colors.NC}\n"
+    f"  {Colors.SAPPHIRE}4.{Colors.NC} {Colors.TEXT}.skip.update-readme{Colors.NC}  {Colors.SUBTEXT}(skip README updates){Colors.NC}\n"
+    f"  {Colors.RED}5.{Colors.NC} {Colors.TEXT}Exit{Colors.NC}\n\n"
+)
+
+SEPARATOR = f"{Colors.MAUVE}{'='*70}{Colors.NC}"
+
+MENU_PROMPT = f"{Colors.MAUVE}Enter your choice (1-5):{Colors.NC} "
+CONTENT_PROMPT = f"{Colors.MAUVE}Enter your choice (1-2):{Colors.NC} "
+CUSTOM_CONTENT_PROMPT = f"\n{Colors.MAUVE}Enter your custom content:{Colors.NC} "
+ANOTHER_PROMPT = f"{Colors.MAUVE}Generate another skip file? (y/n):{Colors.NC} "
+
+# Colors are filled in now; {placeholders} are filled per skip file
+RESULT_TEMPLATE = (
+    f"\n{SEPARATOR}\n"
+    + format_header(f"{Icons.CHECK}  Configuration Complete!") + "\n"
+    f"{SEPARATOR}\n\n"
+    f"{Colors.TEXT}File created:{Colors.NC}        {Colors.SAPPHIRE}{{filepath}}{Colors.NC}\n"
+    f"{Colors.TEXT}SHA256 Hash:{Colors.NC}        {Colors.YELLOW}{{content_hash}}{Colors.NC}\n\n"
+    + format_header(f"{Icons.INFO}  Next Steps:") + "\n"
+    f"\n{Colors.TEXT}1. Add this hash as a GitHub Secret:{Colors.NC}\n\n"
+    f"   {Colors.SUBTEXT}Go to: Settings > Secrets and variables > Actions > New repository secret{Colors.NC}\n"
+    f"   {Colors.TEXT}Name:{Colors.NC}  {Colors.GREEN}{{secret_name}}{Colors.NC}\n"
+    f"   {Colors.TEXT}Value:{Colors.NC} {Colors.YELLOW}{{content_hash}}{Colors.NC}\n\n"
+    f"{Colors.TEXT}2. Commit and push the skip file:{Colors.NC}\n\n"
+    f"   {Colors.SUBTEXT}git add {{filepath}}{Colors.NC}\n"
+    f"   {Colors.SUBTEXT}git commit -m \"feat: Add custom skip for {{description}}\"{Colors.NC}\n"
+    f"   {Colors.SUBTEXT}git push{Colors.NC}\n\n"
+    + format_warn("The workflow will be SKIPPED once you push this file AND set the GitHub Secret!") + "\n"
+    f"\n{SEPARATOR}\n\n"
+)
+
+CONTENT_MENU = (
+    f"\n{Colors.TEXT}How do you want to generate the content?{Colors.NC}\n\n"
+    f"  {Colors.SAPPHIRE}1.{Colors.NC} {Colors.TEXT}Enter custom text{Colors.NC}\n"
+    f"  {Colors.SAPPHIRE}2.{Colors.NC} {Colors.TEXT}Generate random secure token{Colors.NC} {Colors.SUBTEXT}(recommended){Colors.NC}\n\n"
+)
+
+def calculate_file_hash(filepath: str) -> str:
+    """Calculate SHA256 hash of a file, matching sha256sum in check-skip.yml."""
+    with open(filepath, 'rb') as f:
+        # file_digest (3.11+) hashes straight from the file buffer
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+        return h.hexdigest()
 
 def generate_random_token() -> str:
     """Generate a cryptographically secure random token."""
@@ -25,13 +76,7 @@ def generate_random_token() -> str:
 
 def print_menu():
     """Display the main menu."""
-    log_header(f"\n{Icons.ROCKET}  Skip File Hash Generator")
-    print(f"\n{Colors.TEXT}Select a skip file to customize:{Colors.NC}\n")
-    print(f"  {Colors.SAPPHIRE}1.{Colors.NC} {Colors.TEXT}.skip.all{Colors.NC}           {Colors.SUBTEXT}(skip all workflows){Colors.NC}")
-    print(f"  {Colors.SAPPHIRE}2.{Colors.NC} {Colors.TEXT}.skip.claude{Colors.NC}        {Colors.SUBTEXT}(skip @claude comments){Colors.NC}")
-    print(f"  {Colors.SAPPHIRE}3.{Colors.NC} {Colors.TEXT}.skip.claude-review{Colors.NC}  {Colors.SUBTEXT}(skip automatic reviews){Colors.NC}")
-    print(f"  {Colors.SAPPHIRE}4.{Colors.NC} {Colors.TEXT}.skip.update-readme{Colors.NC}  {Colors.SUBTEXT}(skip README updates){Colors.NC}")
-    print(f"  {Colors.RED}5.{Colors.NC} {Colors.TEXT}Exit{Colors.NC}\n")
+    sys.stdout.write(MENU)
 
 def get_skip_file_info(choice: str) -> tuple:
     """Return (filename, secret_name, description) for a choice."""
@@ -50,7 +95,7 @@ def main():
     while True:
         print_menu()
 
-        choice = input(f"{Colors.MAUVE}Enter your choice (1-5):{Colors.NC} ").strip()
+        choice = input(MENU_PROMPT).strip()
 
         if choice == '5':
             log_info("Exiting...")
@@ -68,14 +113,12 @@ def main():
         log_info(f"This will skip: {description}")
 
         # Ask for content type
-        print(f"\n{Colors.TEXT}How do you want to generate the content?{Colors.NC}\n")
-        print(f"  {Colors.SAPPHIRE}1.{Colors.NC} {Colors.TEXT}Enter custom text{Colors.NC}")
-        print(f"  {Colors.SAPPHIRE}2.{Colors.NC} {Colors.TEXT}Generate random secure token{Colors.NC} {Colors.SUBTEXT}(recommended){Colors.NC}\n")
+        sys.stdout.write(CONTENT_MENU)
 
-        content_choice = input(f"{Colors.MAUVE}Enter your choice (1-2):{Colors.NC} ").strip()
+        content_choice = input(CONTENT_PROMPT).strip()
 
         if content_choice == '1':
-            custom_content = input(f"\n{Colors.MAUVE}Enter your custom content:{Colors.NC} ").strip()
+            custom_content = input(CUSTOM_CONTENT_PROMPT).strip()
             if not custom_content:
                 log_error("Content cannot be empty!")
                 continue
@@ -86,9 +129,6 @@ def main():
             log_error("Invalid choice!")
             continue
 
-        # Calculate hash
-        content_hash = calculate_hash(custom_content)
-
         # Write skip file
         try:
             with open(filepath, 'w') as f:
@@ -98,31 +138,19 @@ def main():
             log_error(f"Failed to write file: {e}")
             continue
 
-        # Display results
-        print(f"\n{Colors.MAUVE}{'='*70}{Colors.NC}")
-        log_header(f"{Icons.CHECK}  Configuration Complete!")
-        print(f"{Colors.MAUVE}{'='*70}{Colors.NC}\n")
-
-        print(f"{Colors.TEXT}File created:{Colors.NC}        {Colors.SAPPHIRE}{filepath}{Colors.NC}")
-        print(f"{Colors.TEXT}SHA256 Hash:{Colors.NC}        {Colors.YELLOW}{content_hash}{Colors.NC}\n")
+        # Hash the bytes on disk, exactly what the workflow verifies
+        content_hash = calculate_file_hash(filepath)
 
-        log_header(f"{Icons.INFO}  Next Steps:")
-        print(f"\n{Colors.TEXT}1. Add this hash as a GitHub Secret:{Colors.NC}\n")
-        print(f"   {Colors.SUBTEXT}Go to: Settings > Secrets and variables > Actions > New repository secret{Colors.NC}")
-        print(f"   {Colors.TEXT}Name:{Colors.NC}  {Colors.GREEN}{secret_name}{Colors.NC}")
-        print(f"   {Colors.TEXT}Value:{Colors.NC} {Colors.YELLOW}{content_hash}{Colors.NC}\n")
-
-        print(f"{Colors.TEXT}2. Commit and push the skip file:{Colors.NC}\n")
-        print(f"   {Colors.SUBTEXT}git add {filepath}{Colors.NC}")
-        print(f"   {Colors.SUBTEXT}git commit -m \"feat: Add custom skip for {description}\"{Colors.NC}")
-        print(f"   {Colors.SUBTEXT}git push{Colors.NC}\n")
-
-        log_warn(f"The workflow will be SKIPPED once you push this file AND set the GitHub Secret!")
-
-        print(f"\n{Colors.MAUVE}{'='*70}{Colors.NC}\n")
+        # Display results
+        sys.stdout.write(RESULT_TEMPLATE.format(
+            filepath=filepath,
+            content_hash=content_hash,
+            secret_name=secret_name,
+            description=description,
+        ))
 
         # Ask if user wants to continue
-        another = input(f"{Colors.MAUVE}Generate another skip file? (y/n):{Colors.NC} ").strip().lower()
+        another = input(ANOTHER_PROMPT).strip().lower()
         if another != 'y':
             log_success("Done! Have a great day!")
             break
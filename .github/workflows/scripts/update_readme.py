@@ -7,83 +7,75 @@ import sys
 import os
 from pathlib import Path
 
-# Add .sys/theme to path for central theming
+# Add sys/theme to path for central theming
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent.parent.parent  # Go up 3 levels: scripts/ -> workflows/ -> .github/ -> repo root
-sys.path.insert(0, str(REPO_ROOT / '.sys' / 'theme'))
+sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 # Import central theme
-from theme import Colors, Icons, log_success
+from theme import Colors, Icons, log_success, parse_env_file
 
 def load_env_config(repo_root: Path) -> dict:
     """Load configuration from .env file."""
     config = {
-        'SYS_DIR': '.sys',
+        'SYS_DIR': 'sys',
         'GITHUB_DIR': '.github',
         'SCRIPT_DIRS': 'docker,dev,utils'
     }
 
-    # Try .sys/env/.env first, fallback to .sys/env/.env.example
+    # Try sys/env/.env first, fallback to sys/env/.env.example
     sys_env_dir = repo_root / config['SYS_DIR'] / 'env'
     for env_name in ['.env', '.env.example']:
         env_file = sys_env_dir / env_name
         if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
+            config.update(parse_env_file(env_file))
             break
 
     return config
 
+def list_files(dir_path: Path) -> list:
+    """List names of regular files in a directory, sorted."""
+    # DirEntry caches the file type from the directory read
+    with os.scandir(dir_path) as it:
+        return sorted(entry.name for entry in it if entry.is_file())
+
 def scan_files() -> list:
     """Scan repository for all files."""
-    repo_root = Path(__file__).parent.parent.parent.parent  # Go up 4 levels to repo root
-    config = load_env_config(repo_root)
+    config = load_env_config(REPO_ROOT)
     files = []
 
     # Script directories from configuration
     script_dirs = config['SCRIPT_DIRS'].split(',')
     for directory in script_dirs:
         directory = directory.strip()
-        dir_path = repo_root / directory
+        dir_path = REPO_ROOT / directory
         if dir_path.exists():
-            for file in sorted(dir_path.iterdir()):
-                if file.is_file():
-                    files.append(f"{directory}/{file.name}")
+            files.extend(f"{directory}/{name}" for name in list_files(dir_path))
 
-    # System directory (.sys)
-    sys_dir = repo_root / config['SYS_DIR']
+    # System directory (sys)
+    sys_dir = REPO_ROOT / config['SYS_DIR']
     if sys_dir.exists():
-        for file in sorted(sys_dir.iterdir()):
-            if file.is_file():
-                files.append(f"{config['SYS_DIR']}/{file.name}")
+        files.extend(f"{config['SYS_DIR']}/{name}" for name in list_files(sys_dir))
 
     # GitHub skip system directory (.github/skips)
-    github_skips = repo_root / config['GITHUB_DIR'] / 'skips'
+    github_skips = REPO_ROOT / config['GITHUB_DIR'] / 'skips'
     if github_skips.exists():
-        for file in sorted(github_skips.iterdir()):
-            if file.is_file():
-                files.append(f"{config['GITHUB_DIR']}/skips/{file.name}")
+        files.extend(f"{config['GITHUB_DIR']}/skips/{name}" for name in list_files(github_skips))
 
     # Root level files
-    for file in sorted(repo_root.iterdir()):
-        if file.is_file() and file.suffix in ['.sh', '.md', '.py']:
-            if file.name != 'README.md':  # Don't include the README itself
-                files.append(file.name)
+    for name in list_files(REPO_ROOT):
+        if os.path.splitext(name)[1] in ('.sh', '.md', '.py'):
+            if name != 'README.md':  # Don't include the README itself
+                files.append(name)
 
+    # Each group is already in order, so timsort only merges those runs
     return sorted(files)
 
 def generate_readme(files: list) -> str:
     """Generate README with file links."""
-    readme = "# Helper Scripts\n\n"
-
-    for file in files:
-        readme += f"- [{file}]({file})\n"
-
-    return readme
+    parts = ["# Helper Scripts\n\n"]
+    parts.extend(f"- [{file}]({file})\n" for file in files)
+    return "".join(parts)
 
 def main():
     """Main function."""
@@ -91,8 +83,7 @@ def main():
     readme_content = generate_readme(files)
 
     # Write README
-    repo_root = Path(__file__).parent.parent.parent.parent  # Go up 4 levels to repo root
-    readme_path = repo_root / 'README.md'
+    readme_path = REPO_ROOT / 'README.md'
 
     with open(readme_path, 'w') as f:
         f.write(readme_content)
@@ -4,9 +4,17 @@ Style and theming checker for helper scripts
 Validates coding guidelines and Catppuccin Mocha theming consistency
 """
 
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, TextIO, Tuple
 
 # Add sys/theme to path for central theming
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -14,7 +22,8 @@ REPO_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 from theme import (  # noqa: E402
-    Colors, Icons, log_success, log_error, log_warn, log_info
+    Colors, Icons, log_error,
+    format_success, format_error, format_warn, format_info, parse_env_file
 )
 
 
@@ -31,12 +40,7 @@ def load_env_config(repo_root: Path) -> dict:
     for env_name in ['.env', '.env.example']:
         env_file = sys_env_dir / env_name
         if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
+            config.update(parse_env_file(env_file))
             break
 
     return config
@@ -52,6 +56,82 @@ EXPECTED_COLORS = {
     'TEXT': '205;214;244',
 }
 
+LOG_FUNCTIONS = ['log_error', 'log_success', 'log_info', 'log_warn']
+
+# Color definitions with their assigned value, e.g. readonly RED='\033[38;2;...m'
+COLOR_DEF_PATTERN = re.compile(
+    rb'^[ \t]*(?:readonly[ \t]+)?(' + '|'.join(EXPECTED_COLORS).encode() + rb')=(.*)$',
+    re.MULTILINE
+)
+
+# STYLECHECK_IGNORE is only honoured within the first bytes of a file
+HEAD_SIZE = 4096
+
+# Accepted first-line prefixes
+SHEBANGS = (b'#!/bin/bash', b'#!/usr/bin/env python3')
+
+# Bump when the checks change so cached results are discarded
+CACHE_VERSION = 1
+
+# Markers every shell script must contain, with the error for each
+SH_REQUIRED_MARKERS = {
+    'set -e': "    Missing: set -e",
+    'set -o pipefail': "    Missing: set -o pipefail",
+}
+
+
+def _walk(base: str, suffixes: Tuple[str, ...], recursive: bool) -> Iterator[str]:
+    """Yield paths of files under base whose names end with one of suffixes"""
+    # Visiting names in order yields paths already sorted, with no global sort
+    with os.scandir(base) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from _walk(entry.path, suffixes, recursive)
+        elif entry.name.endswith(suffixes) and entry.is_file():
+            yield entry.path
+
+
+@dataclass
+class FileResult:
+    """Outcome of checking a single file, with its messages buffered"""
+    filepath: Path
+    signature: Tuple[int, int] = (0, 0)
+    digest: str = ''
+    skipped: bool = False
+    cached: bool = False
+    issues: int = 0
+    warnings: int = 0
+    messages: List[Tuple[TextIO, str]] = field(default_factory=list)
+
+    def warn(self, msg: str):
+        """Record a warning message"""
+        self.messages.append((sys.stdout, format_warn(msg)))
+        self.warnings += 1
+
+    def error(self, msg: str):
+        """Record an error message"""
+        self.messages.append((sys.stderr, format_error(msg)))
+
+
+def write_lines(lines: List[Tuple[TextIO, str]]):
+    """Write buffered lines with one write() per run of lines on the same stream"""
+    for stream, group in itertools.groupby(lines, key=lambda line: line[0]):
+        text = ''.join(f'{line}\n' for _, line in group)
+        binary = getattr(stream, 'buffer', None)
+
+        if binary is None:
+            stream.write(text)
+            continue
+
+        # Encode once and bypass the TextIOWrapper; all checker output goes
+        # through here, so nothing is pending in the text layer
+        binary.write(text.encode(stream.encoding, stream.errors))
+        if stream.line_buffering:
+            binary.flush()
+
 
 class StyleChecker:
     def __init__(self):
@@ -61,127 +141,224 @@ class StyleChecker:
         self.warnings = 0
         self.ignored_files = self._load_ignore_list()
         self.config = load_env_config(REPO_ROOT)
+        sys_dir = self.config.get('SYS_DIR', 'sys')
+        self.env_path = f'{sys_dir}/env/.env'
+        self._marker_pattern = self._build_marker_pattern()
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        self.cache_path = Path(cache_home) / 'helper-scripts' / 'stylecheck.json'
+        self._cache = self._load_cache()
+        self._good_digests = {entry[2] for entry in self._cache.values()}
+        self._type_checks = {'.sh': self._sh_checks, '.py': self._py_checks}
+
+    def _load_cache(self) -> dict:
+        """Load [mtime_ns, size, content digest] of files that passed cleanly"""
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        if data.get('version') != CACHE_VERSION or data.get('env_path') != self.env_path:
+            return {}
+        return data.get('files', {})
+
+    def _save_cache(self):
+        """Write the cache atomically; an unwritable cache dir just skips caching"""
+        data = {'version': CACHE_VERSION, 'env_path': self.env_path, 'files': self._cache}
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _build_marker_pattern(self) -> re.Pattern:
+        """Compile every literal marker the checks look for into one pattern"""
+        markers = ['set -e', 'set -o pipefail', 'load_env', self.env_path, 'RED=']
+        markers.extend(LOG_FUNCTIONS)
+
+        # 'readonly RED=' consumes the 'RED=' it contains, so it is
+        # matched as its own alternative and the inner marker implied
+        self._implied_markers = {'readonly RED=': 'RED='}
+        markers.extend(self._implied_markers)
+
+        # Plain alternation (no lookahead) keeps the regex engine's
+        # first-character fast skip, so the scan stays in C. All markers
+        # are ASCII, so the raw bytes are scanned without decoding
+        alternation = '|'.join(re.escape(m) for m in sorted(set(markers), key=len, reverse=True))
+        return re.compile(alternation.encode())
+
+    def scan_markers(self, content: bytes) -> set:
+        """Return the set of markers present in content (single pass)"""
+        hits = {m.decode() for m in set(self._marker_pattern.findall(content))}
+        hits.update(self._implied_markers[m] for m in hits & self._implied_markers.keys())
+        return hits
 
     def _load_ignore_list(self) -> set:
         """Not used - files self-declare ignore status"""
         return set()
 
-    def should_ignore(self, filepath: Path) -> bool:
+    def should_ignore(self, head: bytes) -> bool:
         """Check if file contains STYLECHECK_IGNORE marker"""
-        try:
-            content = filepath.read_text(encoding='utf-8')
-            # Check first 10 lines for the marker
-            for line in content.split('\n')[:10]:
-                if 'STYLECHECK_IGNORE' in line:
-                    return True
-        except Exception:
-            pass
-        return False
+        # Most files never mention the marker; only split to confirm
+        # it sits within the first 10 lines when it is present at all
+        if b'STYLECHECK_IGNORE' not in head:
+            return False
+        return any(b'STYLECHECK_IGNORE' in line for line in head.split(b'\n', 10)[:10])
 
-    def check_colors(self, filepath: Path) -> int:
+    def check_colors(self, color_defs: List[Tuple[bytes, bytes]], result: FileResult) -> int:
         """Check if file uses correct Catppuccin Mocha colors"""
         issues = 0
-        content = filepath.read_text(encoding='utf-8')
+        defined = set()
+        correct = set()
+
+        # A color is correct if one of its definitions carries the RGB value
+        for name, value in color_defs:
+            color_name = name.decode()
+            defined.add(color_name)
+            if EXPECTED_COLORS[color_name].encode() in value:
+                correct.add(color_name)
 
         for color_name, expected_rgb in EXPECTED_COLORS.items():
             # Check if color is defined
-            if f'readonly {color_name}=' in content or f'{color_name}=' in content:
+            if color_name in defined:
                 # Verify correct RGB values
-                if expected_rgb not in content:
-                    log_warn(f"    Incorrect RGB for {color_name} (expected: {expected_rgb})")
+                if color_name not in correct:
+                    result.warn(f"    Incorrect RGB for {color_name} (expected: {expected_rgb})")
                     issues += 1
-                    self.warnings += 1
 
         return issues
 
-    def check_standards(self, filepath: Path) -> int:
-        """Check coding standards"""
+    def check_standards(self, content: bytes, result: FileResult) -> int:
+        """Check coding standards shared by all file types"""
         issues = 0
-        content = filepath.read_text(encoding='utf-8')
-        lines = content.split('\n')
 
         # Check shebang
-        if lines and not (lines[0].startswith('#!/bin/bash') or lines[0].startswith('#!/usr/bin/env python3')):
-            log_error("    Invalid or missing shebang")
+        if not content.startswith(SHEBANGS):
+            result.error("    Invalid or missing shebang")
             issues += 1
 
-        if filepath.suffix == '.sh':
-            # Check for set -e
-            if 'set -e' not in content:
-                log_error("    Missing: set -e")
-                issues += 1
+        return issues
 
-            # Check for set -o pipefail
-            if 'set -o pipefail' not in content:
-                log_error("    Missing: set -o pipefail")
-                issues += 1
+    def _sh_checks(self, content: bytes, hits: set, result: FileResult) -> int:
+        """Check shell script standards and structure"""
+        issues = 0
+
+        # Check for set -e and set -o pipefail (healthy scripts have both)
+        if not SH_REQUIRED_MARKERS.keys() <= hits:
+            for marker, message in SH_REQUIRED_MARKERS.items():
+                if marker not in hits:
+                    result.error(message)
+                    issues += 1
+
+        # Check for readonly usage with colors
+        if 'RED=' in hits and 'readonly RED=' not in hits:
+            result.warn("    Color variables should be readonly")
+            issues += 1
 
-            # Check for readonly usage with colors
-            if 'RED=' in content and 'readonly RED=' not in content:
-                log_warn("    Color variables should be readonly")
+        # Check for logging functions if colors are used
+        if 'readonly RED=' in hits:
+            if not any(fn in hits for fn in LOG_FUNCTIONS):
+                result.warn("    Script uses colors but has no logging functions")
                 issues += 1
-                self.warnings += 1
 
-        return issues
+        # Check for .env integration
+        if self.env_path not in hits:
+            result.warn(f"    Missing .env integration ({self.env_path})")
 
-    def check_structure(self, filepath: Path) -> int:
-        """Check script structure"""
-        issues = 0
-        content = filepath.read_text(encoding='utf-8')
-        lines = content.split('\n')
-
-        if filepath.suffix == '.sh':
-            # Check for logging functions if colors are used
-            if 'readonly RED=' in content:
-                if not any(fn in content for fn in ['log_error', 'log_success', 'log_info', 'log_warn']):
-                    log_warn("    Script uses colors but has no logging functions")
-                    issues += 1
-                    self.warnings += 1
-
-            # Check for .env integration
-            sys_dir = self.config.get('SYS_DIR', 'sys')
-            env_path = f'{sys_dir}/env/.env'
-            if env_path not in content and f'source "$REPO_ROOT/{env_path}"' not in content:
-                log_warn(f"    Missing .env integration ({env_path})")
-                self.warnings += 1
-
-            # Check for description comment on line 2
-            if len(lines) > 1 and not lines[1].startswith('#'):
-                log_warn("    Missing description comment on line 2")
-                self.warnings += 1
-
-        if filepath.suffix == '.py':
-            # Check for .env integration in Python scripts
-            if 'load_env' not in content:
-                log_warn("    Missing .env integration (load_env function)")
-                self.warnings += 1
+        # Check for description comment on line 2
+        line2 = content.find(b'\n') + 1
+        if line2 and content[line2:line2 + 1] != b'#':
+            result.warn("    Missing description comment on line 2")
 
         return issues
 
-    def check_file(self, filepath: Path) -> bool:
-        """Check a single file"""
-        # Skip ignored files
-        if self.should_ignore(filepath):
-            print(f"{Colors.SUBTEXT}Skipping: {Colors.YELLOW}{filepath.name}{Colors.NC} {Colors.SUBTEXT}(STYLECHECK_IGNORE){Colors.NC}")
-            return True  # Count as passed
+    def _py_checks(self, content: bytes, hits: set, result: FileResult) -> int:
+        """Check Python script structure"""
+        # Check for .env integration in Python scripts
+        if 'load_env' not in hits:
+            result.warn("    Missing .env integration (load_env function)")
+
+        return 0
+
+    def check_file(self, filepath: Path) -> FileResult:
+        """Check a single file (no output, safe to run in worker threads)"""
+        st = filepath.stat()
+        result = FileResult(filepath, signature=(st.st_mtime_ns, st.st_size))
+
+        # Unchanged files that passed cleanly last time need no re-check
+        entry = self._cache.get(os.path.abspath(filepath))
+        if entry and entry[:2] == list(result.signature):
+            result.digest = entry[2]
+            result.cached = True
+            return result
+
+        with open(filepath, 'rb') as f:
+            # The ignore marker lives in the header; skip before reading the rest
+            head = f.read(HEAD_SIZE)
+            if self.should_ignore(head):
+                result.skipped = True
+                return result
+            content = head + f.read()
+
+        suffix = filepath.suffix
+
+        # Identical content (copies, renames, touched files) passed before;
+        # the suffix is hashed too since .sh and .py are checked differently
+        result.digest = hashlib.blake2b(
+            suffix.encode() + b'\0' + content, digest_size=16
+        ).hexdigest()
+        if result.digest in self._good_digests:
+            result.cached = True
+            return result
+
+        # Scan all markers in a single pass
+        hits = self.scan_markers(content)
 
-        file_issues = 0
+        # Run all checks
+        result.issues += self.check_colors(COLOR_DEF_PATTERN.findall(content), result)
+        result.issues += self.check_standards(content, result)
+        type_checks = self._type_checks.get(suffix)
+        if type_checks:
+            result.issues += type_checks(content, hits, result)
+
+        return result
+
+    def report(self, result: FileResult) -> bool:
+        """Write the buffered output of a file check and update counters"""
+        filename = result.filepath.name
+        out = sys.stdout
+
+        if result.skipped:
+            write_lines([
+                (out, f"{Colors.SUBTEXT}Skipping: {Colors.YELLOW}{filename}{Colors.NC} {Colors.SUBTEXT}(STYLECHECK_IGNORE){Colors.NC}"),
+                (out, ''),
+            ])
+            return True  # Count as passed
 
-        print(f"{Colors.TEXT}Checking: {Colors.SAPPHIRE}{filepath.name}{Colors.NC}")
+        lines = [(out, f"{Colors.TEXT}Checking: {Colors.SAPPHIRE}{filename}{Colors.NC}")]
+        lines.extend(result.messages)
+        self.warnings += result.warnings
 
-        # Run all checks
-        file_issues += self.check_colors(filepath)
-        file_issues += self.check_standards(filepath)
-        file_issues += self.check_structure(filepath)
+        # Remember files that passed with no warnings at all
+        cache_key = os.path.abspath(result.filepath)
+        if result.issues == 0 and result.warnings == 0:
+            self._cache[cache_key] = [*result.signature, result.digest]
+            self._good_digests.add(result.digest)
+        else:
+            self._cache.pop(cache_key, None)
 
-        if file_issues == 0:
-            log_success("  All checks passed")
+        passed = result.issues == 0
+        if passed:
+            lines.append((out, format_success("  All checks passed")))
             self.passed_files += 1
-            return True
         else:
-            log_error(f"  Found {file_issues} issue(s)")
+            lines.append((sys.stderr, format_error(f"  Found {result.issues} issue(s)")))
             self.failed_files += 1
-            return False
+
+        lines.append((out, ''))
+        write_lines(lines)
+        return passed
 
     def scan_files(self, base_path: Path, types: List[str], recursive: bool) -> List[Path]:
         """Scan for files to check"""
@@ -190,20 +367,21 @@ class StyleChecker:
         if base_path.is_file():
             files.append(base_path)
         elif base_path.is_dir():
-            for ext in types:
-                ext = ext.lstrip('*.')
-                pattern = f'**/*.{ext}' if recursive else f'*.{ext}'
-                files.extend(base_path.glob(pattern))
+            suffixes = tuple(f".{ext.lstrip('*.')}" for ext in types)
+            files.extend(map(Path, _walk(str(base_path), suffixes, recursive)))
 
-        return sorted(files)
+        return files
 
     def run(self, base_path: Path, types: List[str], recursive: bool) -> int:
         """Run style checker"""
-        print()
-        print(f"{Colors.MAUVE}[style]{Colors.NC} {Icons.CHART}  Helper Scripts Style Checker")
-        print()
-        log_info("Validating coding guidelines and theming consistency")
-        print()
+        out = sys.stdout
+        write_lines([
+            (out, ''),
+            (out, f"{Colors.MAUVE}[style]{Colors.NC} {Icons.CHART}  Helper Scripts Style Checker"),
+            (out, ''),
+            (out, format_info("Validating coding guidelines and theming consistency")),
+            (out, ''),
+        ])
 
         files = self.scan_files(base_path, types, recursive)
 
@@ -211,40 +389,44 @@ class StyleChecker:
             log_error(f"No files found matching types: {', '.join(types)}")
             return 1
 
-        log_info(f"Checking {len(files)} file(s)")
-        print()
+        write_lines([(out, format_info(f"Checking {len(files)} file(s)")), (out, '')])
+
+        # Files are checked concurrently; results are reported in order
+        with ThreadPoolExecutor() as executor:
+            for result in executor.map(self.check_file, files):
+                self.report(result)
+                self.total_files += 1
 
-        for filepath in files:
-            self.check_file(filepath)
-            self.total_files += 1
-            print()
+        self._save_cache()
 
         # Print summary
-        print(f"{Colors.MAUVE}Summary{Colors.NC}")
-        print()
-        print(f"{Colors.TEXT}Total files checked:   {Colors.NC}{Colors.SAPPHIRE}{self.total_files}{Colors.NC}")
-        print(f"{Colors.GREEN}Passed:                {Colors.NC}{Colors.SAPPHIRE}{self.passed_files}{Colors.NC}")
+        summary = [
+            (out, f"{Colors.MAUVE}Summary{Colors.NC}"),
+            (out, ''),
+            (out, f"{Colors.TEXT}Total files checked:   {Colors.NC}{Colors.SAPPHIRE}{self.total_files}{Colors.NC}"),
+            (out, f"{Colors.GREEN}Passed:                {Colors.NC}{Colors.SAPPHIRE}{self.passed_files}{Colors.NC}"),
+        ]
 
         if self.failed_files > 0:
-            print(f"{Colors.RED}Failed:                {Colors.NC}{Colors.SAPPHIRE}{self.failed_files}{Colors.NC}")
+            summary.append((out, f"{Colors.RED}Failed:                {Colors.NC}{Colors.SAPPHIRE}{self.failed_files}{Colors.NC}"))
 
         if self.warnings > 0:
-            print(f"{Colors.YELLOW}Warnings:              {Colors.NC}{Colors.SAPPHIRE}{self.warnings}{Colors.NC}")
+            summary.append((out, f"{Colors.YELLOW}Warnings:              {Colors.NC}{Colors.SAPPHIRE}{self.warnings}{Colors.NC}"))
 
-        print()
+        summary.append((out, ''))
 
         if self.failed_files > 0:
-            log_error("Style check failed")
+            summary.append((sys.stderr, format_error("Style check failed")))
+            write_lines(summary)
             return 1
         else:
-            log_success("All checks passed!")
+            summary.append((out, format_success("All checks passed!")))
+            write_lines(summary)
             return 0
 
 
 def main():
     """Main function"""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description='Style and theming checker for helper scripts',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -4,10 +4,13 @@ Shell script formatter using shfmt (like cargo fmt for Rust)
 Automatically formats all shell scripts in the repository
 """
 
+import argparse
+import os
+import re
 import sys
 import subprocess
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 # Add sys/theme to path for central theming
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -15,7 +18,9 @@ REPO_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 # Import central theme
-from theme import Colors, Icons, log_success, log_error, log_warn, log_info
+from theme import (
+    Colors, Icons, log_success, log_error, log_warn, log_info, parse_env_file
+)
 
 
 def load_env_config(repo_root: Path) -> dict:
@@ -31,12 +36,7 @@ def load_env_config(repo_root: Path) -> dict:
     for env_name in ['.env', '.env.example']:
         env_file = sys_env_dir / env_name
         if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
+            config.update(parse_env_file(env_file))
             break
 
     return config
@@ -45,6 +45,11 @@ def load_env_config(repo_root: Path) -> dict:
 # shfmt configuration options
 SHFMT_OPTS = ['-i', '4', '-bn', '-ci', '-sr']
 
+# Maximum number of files passed to a single shfmt invocation (ARG_MAX)
+BATCH_SIZE = 256
+
+SHFMT_ERROR_PATTERN = re.compile(r'^(.+):\d+:\d+: ', re.MULTILINE)
+
 
 def check_shfmt() -> bool:
     """Check if shfmt is installed"""
@@ -79,41 +84,84 @@ def get_shfmt_version() -> str:
         return "unknown"
 
 
-def format_file(filepath: Path, check_mode: bool = False) -> int:
+def format_files(files: List[Path], check_mode: bool = False) -> List[int]:
     """
-    Format a single shell script file
-    Returns: 0=formatted, 1=unchanged, 2=failed
+    Format shell script files with one shfmt process per batch
+    Returns: status per file, 0=formatted, 1=unchanged, 2=failed
     """
-    filename = filepath.name
+    statuses = []
 
-    # Check if file needs formatting
-    try:
-        subprocess.run(
-            ['shfmt'] + SHFMT_OPTS + ['-d', str(filepath)],
+    for start in range(0, len(files), BATCH_SIZE):
+        batch = files[start:start + BATCH_SIZE]
+        # -l lists the files whose formatting differs; -w also rewrites them
+        mode = ['-l'] if check_mode else ['-l', '-w']
+
+        result = subprocess.run(
+            ['shfmt'] + SHFMT_OPTS + mode + [str(f) for f in batch],
             capture_output=True,
-            check=True
+            text=True
         )
-        # File is already formatted
+        changed = set(result.stdout.splitlines())
+
+        # Parse errors are reported as "path:line:col: message"
+        failed = set(SHFMT_ERROR_PATTERN.findall(result.stderr))
+
+        for filepath in batch:
+            path = str(filepath)
+            if path in failed:
+                # A file shfmt cannot parse needs attention in check mode
+                statuses.append(0 if check_mode else 2)
+            elif path in changed:
+                statuses.append(0)
+            elif result.returncode != 0:
+                # Other errors (e.g. an unreadable file) name no position,
+                # so unaccounted files of a failed batch are run one by one
+                statuses.append(format_single(filepath, mode, check_mode))
+            else:
+                statuses.append(1)
+
+    return statuses
+
+
+def format_single(filepath: Path, mode: List[str], check_mode: bool = False) -> int:
+    """Run shfmt on a single file, return its status as in format_files"""
+    result = subprocess.run(
+        ['shfmt'] + SHFMT_OPTS + mode + [str(filepath)],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return 0 if check_mode else 2
+    return 0 if result.stdout.strip() else 1
+
+
+def report_file(filepath: Path, status: int, check_mode: bool = False):
+    """Print the formatting result of a single file"""
+    filename = filepath.name
+
+    if status == 1:
         print(f"  {Colors.TEXT}{filename}{Colors.NC} {Colors.SAPPHIRE}(no changes){Colors.NC}")
-        return 1  # unchanged
-    except subprocess.CalledProcessError:
-        # File needs formatting
+    elif status == 0:
         if check_mode:
             log_warn(f"  {filename} needs formatting")
-            return 0  # needs format
         else:
-            # Format the file
-            try:
-                subprocess.run(
-                    ['shfmt'] + SHFMT_OPTS + ['-w', str(filepath)],
-                    check=True,
-                    capture_output=True
-                )
-                log_success(f"  Formatted {filename}")
-                return 0  # formatted
-            except subprocess.CalledProcessError:
-                log_error(f"  Failed to format {filename}")
-                return 2  # failed
+            log_success(f"  Formatted {filename}")
+    else:
+        log_error(f"  Failed to format {filename}")
+
+
+def _walk(base: str, suffixes: Tuple[str, ...], recursive: bool) -> Iterator[str]:
+    """Yield paths of files under base whose names end with one of suffixes"""
+    # Visiting names in order yields paths already sorted, with no global sort
+    with os.scandir(base) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from _walk(entry.path, suffixes, recursive)
+        elif entry.name.endswith(suffixes) and entry.is_file():
+            yield entry.path
 
 
 def scan_files(base_path: Path, types: List[str], recursive: bool) -> List[Path]:
@@ -123,18 +171,14 @@ def scan_files(base_path: Path, types: List[str], recursive: bool) -> List[Path]
     if base_path.is_file():
         files.append(base_path)
     elif base_path.is_dir():
-        for ext in types:
-            ext = ext.lstrip('*.')
-            pattern = f'**/*.{ext}' if recursive else f'*.{ext}'
-            files.extend(base_path.glob(pattern))
+        suffixes = tuple(f".{ext.lstrip('*.')}" for ext in types)
+        files.extend(map(Path, _walk(str(base_path), suffixes, recursive)))
 
-    return sorted(files)
+    return files
 
 
 def main():
     """Main function"""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description='Shell script formatter using shfmt',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -223,8 +267,10 @@ Examples:
     unchanged = 0
     failed = 0
 
-    for filepath in files:
-        result = format_file(filepath, check_mode=args.check)
+    statuses = format_files(files, check_mode=args.check)
+
+    for filepath, result in zip(files, statuses):
+        report_file(filepath, result, check_mode=args.check)
         if result == 0:
             formatted += 1
         elif result == 1:
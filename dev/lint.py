@@ -4,10 +4,13 @@ Shell script linter - checks for common issues
 Basic linting without external tools
 """
 
+import argparse
+import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Set, Tuple
 
 # Add sys/theme to path for central theming
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -15,7 +18,13 @@ REPO_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 # Import central theme
-from theme import Colors, Icons, log_success, log_error, log_warn, log_info
+from theme import (
+    Colors, Icons, log_success, log_error, log_warn, log_info, parse_env_file
+)
+
+
+# Header checks (shebang, ignore marker) only look at the start of a file
+HEAD_SIZE = 4096
 
 
 def load_env_config(repo_root: Path) -> dict:
@@ -31,17 +40,21 @@ def load_env_config(repo_root: Path) -> dict:
     for env_name in ['.env', '.env.example']:
         env_file = sys_env_dir / env_name
         if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
+            config.update(parse_env_file(env_file))
             break
 
     return config
 
 
+def _read_head(filepath: Path, size: int = HEAD_SIZE) -> bytes:
+    """Read at most size bytes from the start of a file"""
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
 def check_syntax(filepath: Path) -> bool:
     """Check shell script syntax"""
     try:
@@ -51,11 +64,17 @@ def check_syntax(filepath: Path) -> bool:
         return False
 
 
+def check_syntax_batch(files: List[Path]) -> Set[Path]:
+    """Check syntax of all files concurrently, return the ones that fail"""
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(check_syntax, files)
+        return {filepath for filepath, ok in zip(files, results) if not ok}
+
+
 def check_shebang(filepath: Path) -> bool:
     """Check for shebang line"""
     try:
-        first_line = filepath.read_text(encoding='utf-8').split('\n')[0]
-        return first_line.startswith('#!')
+        return _read_head(filepath, 2).startswith(b'#!')
     except Exception:
         return False
 
@@ -63,8 +82,8 @@ def check_shebang(filepath: Path) -> bool:
 def check_set_e(filepath: Path) -> bool:
     """Check for set -e or set -o errexit"""
     try:
-        content = filepath.read_text(encoding='utf-8')
-        return 'set -e' in content or 'set -o errexit' in content
+        content = filepath.read_bytes()
+        return b'set -e' in content or b'set -o errexit' in content
     except Exception:
         return False
 
@@ -72,8 +91,7 @@ def check_set_e(filepath: Path) -> bool:
 def check_pipefail(filepath: Path) -> bool:
     """Check for set -o pipefail"""
     try:
-        content = filepath.read_text(encoding='utf-8')
-        return 'set -o pipefail' in content
+        return b'set -o pipefail' in filepath.read_bytes()
     except Exception:
         return False
 
@@ -81,19 +99,18 @@ def check_pipefail(filepath: Path) -> bool:
 def should_ignore(filepath: Path) -> bool:
     """Check if file contains LINTCHECK_IGNORE marker"""
     try:
-        content = filepath.read_text(encoding='utf-8')
         # Check first 10 lines for the marker
-        for line in content.split('\n')[:10]:
-            if 'LINTCHECK_IGNORE' in line:
+        for line in _read_head(filepath).split(b'\n', 10)[:10]:
+            if b'LINTCHECK_IGNORE' in line:
                 return True
     except Exception:
         pass
     return False
 
 
-def lint_file(filepath: Path) -> Tuple[bool, int]:
+def lint_file(filepath: Path, st: os.stat_result, syntax_ok: bool) -> Tuple[bool, int]:
     """
-    Lint a single shell script
+    Lint a single shell script (stat from scan_files, syntax from check_syntax_batch)
     Returns: (passed, critical_issues)
     """
     # Skip ignored files
@@ -106,7 +123,7 @@ def lint_file(filepath: Path) -> Tuple[bool, int]:
     print(f"{Colors.BLUE}Checking {Colors.NC}{filepath}")
 
     # 1. Syntax check
-    if not check_syntax(filepath):
+    if not syntax_ok:
         log_error("  Syntax error detected")
         issues += 1
 
@@ -124,7 +141,7 @@ def lint_file(filepath: Path) -> Tuple[bool, int]:
         issues += 1
 
     # 5. Check executable permission
-    if not filepath.stat().st_mode & 0o111:
+    if not st.st_mode & 0o111:
         log_warn(f"  Script is not executable (chmod +x {filepath.name})")
 
     if issues == 0:
@@ -135,24 +152,36 @@ def lint_file(filepath: Path) -> Tuple[bool, int]:
         return False, issues
 
 
-def scan_files(base_path: Path, recursive: bool) -> List[Path]:
-    """Scan for shell script files"""
+def _walk(base: str, suffixes: Tuple[str, ...], recursive: bool) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) of files under base whose names end with one of suffixes"""
+    # Visiting names in order yields paths already sorted, with no global sort
+    with os.scandir(base) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from _walk(entry.path, suffixes, recursive)
+        elif entry.name.endswith(suffixes) and entry.is_file():
+            # DirEntry caches its stat, so is_file() on a symlink is reused
+            yield entry.path, entry.stat()
+
+
+def scan_files(base_path: Path, recursive: bool) -> List[Tuple[Path, os.stat_result]]:
+    """Scan for shell script files, with the stat gathered during the walk"""
     files = []
 
     if base_path.is_file():
         if base_path.suffix == '.sh':
-            files.append(base_path)
+            files.append((base_path, base_path.stat()))
     elif base_path.is_dir():
-        pattern = '**/*.sh' if recursive else '*.sh'
-        files.extend(base_path.glob(pattern))
+        files.extend((Path(path), st) for path, st in _walk(str(base_path), ('.sh',), recursive))
 
-    return sorted(files)
+    return files
 
 
 def main():
     """Main function"""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description='Shell script linter - checks for common issues',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -209,8 +238,14 @@ Examples:
     passed_scripts = 0
     total_issues = 0
 
-    for filepath in files:
-        passed, issues = lint_file(filepath)
+    # Run all bash -n syntax checks up front, in parallel; ignored files are
+    # skipped by lint_file, so they get no bash -n process either
+    syntax_errors = check_syntax_batch(
+        [filepath for filepath, _ in files if not should_ignore(filepath)]
+    )
+
+    for filepath, st in files:
+        passed, issues = lint_file(filepath, st, filepath not in syntax_errors)
         total_scripts += 1
         if passed:
             passed_scripts += 1
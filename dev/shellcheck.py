@@ -2,13 +2,18 @@
 """
 Temporary shell script linter (Python-based)
 Tests shell scripts for common issues
+Uses the shellcheck binary instead when it is installed
 """
 
+import json
+import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Add sys/theme to path for central theming
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -16,7 +21,18 @@ REPO_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 # Import central theme
-from theme import Colors, Icons
+from theme import Colors, Icons, parse_env_file
+
+# Patterns are compiled once at import, not per linter or per line.
+# Scripts are scanned as bytes, so no decode pass is needed
+ERREXIT_PATTERN = re.compile(rb'\bset\s+-[^ ]*e')
+UNQUOTED_VAR_PATTERN = re.compile(rb'\$[A-Za-z_][A-Za-z0-9_]*(?![}"])')
+READONLY_CONST_PATTERN = re.compile(rb'^readonly\s+[A-Z_][A-Z0-9_]*=')
+UPPERCASE_VAR_PATTERN = re.compile(rb'[A-Z_][A-Z0-9_]*=')
+FUNCTION_HEADER_PATTERN = re.compile(rb'^\s*(function\s+\w+|[a-z_][a-z0-9_]*\(\s*\)\s*{)')
+LOCAL_PATTERN = re.compile(rb'\blocal\b')
+ASSIGNMENT_PATTERN = re.compile(rb'^\s*[a-z_][a-z0-9_]*=')
+READONLY_PREFIX_PATTERN = re.compile(rb'^\s*readonly\b')
 
 
 def load_env_config(repo_root: Path) -> dict:
@@ -32,141 +48,218 @@ def load_env_config(repo_root: Path) -> dict:
     for env_name in ['.env', '.env.example']:
         env_file = sys_env_dir / env_name
         if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
+            config.update(parse_env_file(env_file))
             break
 
     return config
 
 
+def check_syntax(script: Path) -> Optional[str]:
+    """Run bash -n on a script, return its error output if the syntax is invalid"""
+    result = subprocess.run(
+        ['bash', '-n', str(script)],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return result.stderr.strip()
+    return None
+
+
+def check_syntax_batch(scripts: List[Path]) -> Dict[Path, str]:
+    """Check syntax of all scripts concurrently, return errors of the ones that fail"""
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(check_syntax, scripts)
+        return {script: error for script, error in zip(scripts, results) if error is not None}
+
+
 class ShellLinter:
-    def __init__(self, script_path: Path):
+    def __init__(self, script_path: Path, syntax_error: Optional[str] = None):
         self.path = script_path
-        self.content = script_path.read_text()
+        self.syntax_error = syntax_error
+        # Stat the open file so check_executable needs no extra syscall
+        with open(script_path, 'rb') as f:
+            self.stat = os.fstat(f.fileno())
+            self.content = f.read()
         self.lines = self.content.splitlines()
         self.issues = []
         self.warnings = []
 
     def check_syntax(self) -> bool:
-        """Run bash syntax check"""
-        result = subprocess.run(
-            ['bash', '-n', str(self.path)],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            self.issues.append(f"Syntax error: {result.stderr.strip()}")
+        """Report the bash syntax check (run up front by check_syntax_batch)"""
+        if self.syntax_error is not None:
+            self.issues.append(f"Syntax error: {self.syntax_error}")
             return False
         return True
 
     def check_shebang(self) -> bool:
         """Check for proper shebang"""
-        if not self.lines or not self.lines[0].startswith('#!'):
+        if not self.lines or not self.lines[0].startswith(b'#!'):
             self.issues.append("Missing shebang line")
             return False
-        if 'bash' not in self.lines[0]:
-            self.warnings.append(f"Shebang might not be bash: {self.lines[0]}")
+        if b'bash' not in self.lines[0]:
+            self.warnings.append(f"Shebang might not be bash: {self.lines[0].decode(errors='replace')}")
         return True
 
-    def check_set_flags(self):
-        """Check for set -e and set -o pipefail"""
-        has_errexit = any(
-            re.search(r'\bset\s+-[^ ]*e', line) or 'set -o errexit' in line
-            for line in self.lines
-        )
-        has_pipefail = any('set -o pipefail' in line for line in self.lines)
-
-        if not has_errexit:
-            self.warnings.append("Missing 'set -e' or 'set -o errexit'")
-        if not has_pipefail:
-            self.warnings.append("Missing 'set -o pipefail'")
-
     def check_unquoted_variables(self):
         """Check for potentially unquoted variables"""
-        unquoted_pattern = re.compile(r'\$[A-Za-z_][A-Za-z0-9_]*(?![}"])')
-
         for i, line in enumerate(self.lines, 1):
             # Skip comments
-            if line.strip().startswith('#'):
+            if line.strip().startswith(b'#'):
                 continue
 
             # Look for unquoted variables not in quotes
-            if unquoted_pattern.search(line):
+            if UNQUOTED_VAR_PATTERN.search(line):
                 # Basic check - might have false positives
-                if '"' not in line and "'" not in line:
+                if b'"' not in line and b"'" not in line:
+                    text = line.strip().decode(errors='replace')
                     self.warnings.append(
-                        f"Line {i}: Potentially unquoted variable: {line.strip()[:50]}"
+                        f"Line {i}: Potentially unquoted variable: {text[:50]}"
                     )
 
     def check_executable(self) -> bool:
         """Check if script is executable"""
-        if not self.path.stat().st_mode & 0o111:
+        if not self.stat.st_mode & 0o111:
             self.warnings.append("Script is not executable")
             return False
         return True
 
-    def check_readonly_usage(self):
-        """Check if readonly is used for constants"""
-        const_pattern = re.compile(r'^readonly\s+[A-Z_][A-Z0-9_]*=')
-        has_readonly = any(const_pattern.match(line.strip()) for line in self.lines)
-
-        # Check for uppercase variables that might be constants
-        uppercase_vars = re.findall(r'^([A-Z_][A-Z0-9_]*)=', '\n'.join(self.lines), re.MULTILINE)
+    def _scan_lines(self) -> Tuple[bool, bool, bool, bool, int]:
+        """Collect set flags, readonly/uppercase usage and function locals in one pass"""
+        has_errexit = False
+        has_pipefail = False
+        has_readonly = False
+        has_uppercase = False
+        unscoped_functions = 0
 
-        if uppercase_vars and not has_readonly:
-            self.warnings.append("Uppercase variables found but not marked 'readonly'")
-
-    def check_function_locals(self):
-        """Check if functions use local variables"""
         in_function = False
         has_local = False
         has_variable_assignment = False
         function_lines = 0
 
         for line in self.lines:
-            if re.match(r'^\s*(function\s+\w+|[a-z_][a-z0-9_]*\(\s*\)\s*{)', line):
+            # Cheap substring tests gate every regex
+            if not has_errexit and b'set' in line:
+                has_errexit = bool(ERREXIT_PATTERN.search(line)) or b'set -o errexit' in line
+            if not has_pipefail and b'set -o pipefail' in line:
+                has_pipefail = True
+            if b'=' in line:
+                if not has_readonly and b'readonly' in line:
+                    has_readonly = bool(READONLY_CONST_PATTERN.match(line.lstrip()))
+                if not has_uppercase:
+                    has_uppercase = bool(UPPERCASE_VAR_PATTERN.match(line))
+
+            # Check if functions use local variables
+            if (b'(' in line or b'function' in line) and FUNCTION_HEADER_PATTERN.match(line):
                 in_function = True
                 has_local = False
                 has_variable_assignment = False
                 function_lines = 0
-            elif in_function and line.strip() == '}':
+            elif in_function and line.strip() == b'}':
                 # Only warn if function assigns variables but doesn't use local
                 # Skip simple one-liner functions (like logging functions)
                 if has_variable_assignment and not has_local and function_lines > 2:
-                    self.warnings.append("Function assigns variables without 'local'")
+                    unscoped_functions += 1
                 in_function = False
             elif in_function:
                 function_lines += 1
-                if re.search(r'\blocal\b', line):
+                if b'local' in line and LOCAL_PATTERN.search(line):
                     has_local = True
                 # Check for variable assignments (but not $var or readonly)
-                if re.search(r'^\s*[a-z_][a-z0-9_]*=', line) and not re.search(r'^\s*readonly\b', line):
+                if b'=' in line and ASSIGNMENT_PATTERN.search(line) and not READONLY_PREFIX_PATTERN.search(line):
                     has_variable_assignment = True
 
+        return has_errexit, has_pipefail, has_readonly, has_uppercase, unscoped_functions
+
     def lint(self) -> Tuple[int, int]:
-        """Run all checks"""
-        self.check_syntax()
+        """Run all checks (style checks are skipped for scripts with syntax errors)"""
+        syntax_ok = self.check_syntax()
         self.check_shebang()
-        self.check_set_flags()
+
+        # Style warnings add nothing for a script that does not parse
+        if not syntax_ok:
+            self.check_executable()
+            return len(self.issues), len(self.warnings)
+
+        has_errexit, has_pipefail, has_readonly, has_uppercase, unscoped_functions = self._scan_lines()
+
+        # Check for set -e and set -o pipefail
+        if not has_errexit:
+            self.warnings.append("Missing 'set -e' or 'set -o errexit'")
+        if not has_pipefail:
+            self.warnings.append("Missing 'set -o pipefail'")
+
         self.check_executable()
-        self.check_readonly_usage()
-        self.check_function_locals()
+
+        # Check if readonly is used for uppercase variables that might be constants
+        if has_uppercase and not has_readonly:
+            self.warnings.append("Uppercase variables found but not marked 'readonly'")
+
+        self.warnings.extend(["Function assigns variables without 'local'"] * unscoped_functions)
         # self.check_unquoted_variables()  # Too many false positives
 
         return len(self.issues), len(self.warnings)
 
 
-def main():
-    print(f"{Colors.MAUVE}[lint]{Colors.NC} Linting shell scripts with Python...")
-    print()
+def lint_with_python(scripts: List[Path]) -> Dict[Path, Tuple[List[str], List[str]]]:
+    """Lint scripts with ShellLinter, return (issues, warnings) per script"""
+    # bash -n dominates; run it for all scripts concurrently up front
+    syntax_errors = check_syntax_batch(scripts)
+
+    results = {}
+    for script in scripts:
+        linter = ShellLinter(script, syntax_errors.get(script))
+        linter.lint()
+        results[script] = (linter.issues, linter.warnings)
+    return results
+
+
+def lint_with_shellcheck(shellcheck: str, scripts: List[Path]) -> Optional[Dict[Path, Tuple[List[str], List[str]]]]:
+    """Lint all scripts with one shellcheck run, return (issues, warnings) per script or None if it fails"""
+    results = {script: ([], []) for script in scripts}
+    if not scripts:
+        return results
+
+    by_name = {str(script): script for script in scripts}
+    result = subprocess.run(
+        [shellcheck, '--format=json1', *by_name],
+        capture_output=True,
+        text=True
+    )
+
+    # Exit codes 0 and 1 mean clean and issues found; anything else (e.g. an
+    # older shellcheck without json1) leaves no report to parse
+    if result.returncode not in (0, 1) or not result.stdout.strip():
+        stderr = result.stderr.strip()
+        reason = stderr.splitlines()[0] if stderr else f"exit code {result.returncode}"
+        print(f"{Colors.YELLOW}{Icons.WARN}  {Colors.NC}shellcheck failed ({reason}), "
+              f"using the Python linter", file=sys.stderr)
+        return None
+
+    for comment in json.loads(result.stdout)['comments']:
+        issues, warnings = results[by_name[comment['file']]]
+        message = f"Line {comment['line']}: SC{comment['code']}: {comment['message']}"
+        if comment['level'] == 'error':
+            issues.append(message)
+        elif comment['level'] == 'warning':
+            warnings.append(message)
+
+    return results
+
 
+def main():
+    shellcheck = shutil.which('shellcheck')
     script_dir = Path.cwd()
     shell_scripts = sorted(script_dir.glob('*.sh'))
 
+    results = lint_with_shellcheck(shellcheck, shell_scripts) if shellcheck else None
+    linter_name = 'shellcheck' if results is not None else 'Python'
+    print(f"{Colors.MAUVE}[lint]{Colors.NC} Linting shell scripts with {linter_name}...")
+    print()
+
+    if results is None:
+        results = lint_with_python(shell_scripts)
+
     total_issues = 0
     total_warnings = 0
     passed = 0
@@ -174,23 +267,22 @@ def main():
     for script in shell_scripts:
         print(f"{Colors.BLUE}Checking {Colors.NC}{script.name}")
 
-        linter = ShellLinter(script)
-        issues, warnings = linter.lint()
+        issues, warnings = results[script]
 
         # Print issues
-        for issue in linter.issues:
+        for issue in issues:
             print(f"  {Colors.RED}{Icons.CROSS}  {Colors.NC}{issue}")
             total_issues += 1
 
         # Print warnings
-        for warning in linter.warnings:
+        for warning in warnings:
             print(f"  {Colors.YELLOW}{Icons.WARN}  {Colors.NC}{warning}")
             total_warnings += 1
 
-        if not linter.issues and not linter.warnings:
+        if not issues and not warnings:
             print(f"  {Colors.GREEN}{Icons.CHECK}  {Colors.NC}Perfect! No issues found")
             passed += 1
-        elif not linter.issues:
+        elif not issues:
             print(f"  {Colors.GREEN}{Icons.CHECK}  {Colors.NC}No critical issues")
             passed += 1
 
@@ -6,6 +6,7 @@ Temporary file - not committed to repository
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add sys/theme to path for central theming
@@ -14,7 +15,7 @@ REPO_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 # Import central theme
-from theme import Colors, Icons
+from theme import Colors, Icons, parse_env_file
 
 
 def load_env_config(repo_root: Path) -> dict:
@@ -30,12 +31,7 @@ def load_env_config(repo_root: Path) -> dict:
     for env_name in ['.env', '.env.example']:
         env_file = sys_env_dir / env_name
         if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
+            config.update(parse_env_file(env_file))
             break
 
     return config
@@ -52,18 +48,21 @@ class TestRunner:
         self.tests.append((name, func))
 
     def run_command(self, cmd, check_output=None):
-        """Run a command and optionally check output"""
+        """Run a command (argv list, no shell) and optionally check output"""
         try:
             result = subprocess.run(
                 cmd,
-                shell=True,
                 capture_output=True,
                 text=True,
                 timeout=10
             )
 
-            if check_output and check_output not in result.stdout:
-                return False, f"Output check failed: '{check_output}' not in output"
+            # Like the former "cmd | grep -q", an output check decides on its
+            # own; the command's exit status is not considered
+            if check_output:
+                if check_output not in result.stdout:
+                    return False, f"Output check failed: '{check_output}' not in output"
+                return True, result.stderr or result.stdout
 
             return result.returncode == 0, result.stderr or result.stdout
         except subprocess.TimeoutExpired:
@@ -76,9 +75,14 @@ class TestRunner:
         print(f"{Colors.MAUVE}[test]{Colors.NC} Running shell script tests...")
         print()
 
-        for name, test_func in self.tests:
+        # Tests are independent subprocess calls; run them concurrently
+        # and report in registration order
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(test_func) for _, test_func in self.tests]
+
+        for (name, _), future in zip(self.tests, futures):
             try:
-                success, message = test_func()
+                success, message = future.result()
                 if success:
                     print(f"{Colors.GREEN}{Icons.CHECK}  {Colors.NC}{name}")
                     self.passed += 1
@@ -114,52 +118,54 @@ def main():
 
     # lines.sh tests
     runner.test("lines.sh: syntax is valid",
-                lambda: runner.run_command("bash -n lines.sh"))
+                lambda: runner.run_command(["bash", "-n", "lines.sh"]))
     runner.test("lines.sh: is executable",
                 lambda: (Path("lines.sh").stat().st_mode & 0o111 != 0, ""))
     runner.test("lines.sh: runs successfully",
-                lambda: runner.run_command("./lines.sh 200"))
+                lambda: runner.run_command(["./lines.sh", "200"]))
     runner.test("lines.sh: shows summary",
-                lambda: runner.run_command("./lines.sh 200 | grep -q 'Summary:'"))
+                lambda: runner.run_command(["./lines.sh", "200"], check_output="Summary:"))
     runner.test("lines.sh: accepts custom limit",
-                lambda: runner.run_command("./lines.sh 100 | grep -q 'limit: 100 lines'"))
+                lambda: runner.run_command(["./lines.sh", "100"], check_output="limit: 100 lines"))
 
     # lint.sh tests
     runner.test("lint.sh: syntax is valid",
-                lambda: runner.run_command("bash -n lint.sh"))
+                lambda: runner.run_command(["bash", "-n", "lint.sh"]))
     runner.test("lint.sh: is executable",
                 lambda: (Path("lint.sh").stat().st_mode & 0o111 != 0, ""))
 
     # rebuild.sh tests
     runner.test("rebuild.sh: syntax is valid",
-                lambda: runner.run_command("bash -n rebuild.sh"))
+                lambda: runner.run_command(["bash", "-n", "rebuild.sh"]))
     runner.test("rebuild.sh: is executable",
                 lambda: (Path("rebuild.sh").stat().st_mode & 0o111 != 0, ""))
     runner.test("rebuild.sh: shows help",
-                lambda: runner.run_command("./rebuild.sh --help | grep -q 'Usage:'"))
+                lambda: runner.run_command(["./rebuild.sh", "--help"], check_output="Usage:"))
 
     # start.sh tests
     runner.test("start.sh: syntax is valid",
-                lambda: runner.run_command("bash -n start.sh"))
+                lambda: runner.run_command(["bash", "-n", "start.sh"]))
     runner.test("start.sh: is executable",
                 lambda: (Path("start.sh").stat().st_mode & 0o111 != 0, ""))
 
     # stop.sh tests
     runner.test("stop.sh: syntax is valid",
-                lambda: runner.run_command("bash -n stop.sh"))
+                lambda: runner.run_command(["bash", "-n", "stop.sh"]))
     runner.test("stop.sh: is executable",
                 lambda: (Path("stop.sh").stat().st_mode & 0o111 != 0, ""))
 
-    # General tests
+    # General tests (share one directory scan)
+    shell_scripts = list(Path.cwd().glob("*.sh"))
+
     def check_shebangs():
-        for script in Path.cwd().glob("*.sh"):
+        for script in shell_scripts:
             with open(script) as f:
                 if not f.readline().startswith("#!"):
                     return False, f"{script.name} missing shebang"
         return True, ""
 
     def check_set_e():
-        for script in Path.cwd().glob("*.sh"):
+        for script in shell_scripts:
             content = script.read_text()
             if "set -e" not in content and "set -o errexit" not in content:
                 return False, f"{script.name} missing set -e"
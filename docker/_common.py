@@ -0,0 +1,76 @@
+"""
+Shared helpers for the Docker container scripts
+STYLECHECK_IGNORE - Python module, no shebang needed
+"""
+
+import functools
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
+
+from theme import (  # noqa: E402,F401
+    Colors, Icons, log_success, log_error, log_warn, log_info, parse_env_file
+)
+
+
+def load_env_config(repo_root: Path) -> dict:
+    """Load configuration from .env file"""
+    config = {
+        'SYS_DIR': 'sys',
+        'GITHUB_DIR': '.github',
+        'SCRIPT_DIRS': 'docker,dev,utils,rust',
+        'CONTAINER_NAME': 'your-container-name',
+        'IMAGE_NAME': 'your-image-name:latest',
+        'DISPLAY_NAME': 'Your Service',
+        'DOCKERFILE_PATH': './Dockerfile'
+    }
+
+    sys_env_dir = repo_root / config['SYS_DIR'] / 'env'
+    for env_name in ['.env', '.env.example']:
+        env_file = sys_env_dir / env_name
+        if env_file.exists():
+            config.update(parse_env_file(env_file))
+            break
+
+    return config
+
+
+@functools.lru_cache(maxsize=1)
+def container_states() -> dict:
+    """Map every container name to its state with a single docker ps call."""
+    try:
+        result = subprocess.run(
+            ['docker', 'ps', '-a', '--format', '{{.Names}}\t{{.State}}'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        return {}
+    return dict(
+        line.split('\t', 1) for line in result.stdout.splitlines() if '\t' in line
+    )
+
+
+def container_exists(name: str) -> bool:
+    """Check if container exists."""
+    return name in container_states()
+
+
+def is_running(name: str) -> bool:
+    """Check if container is running."""
+    return container_states().get(name) == 'running'
+
+
+def wait_for_exit(name: str, timeout: float) -> bool:
+    """Block until the container exits; False if still up after timeout."""
+    try:
+        subprocess.run(['docker', 'wait', name], capture_output=True,
+                       timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        return False
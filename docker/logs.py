@@ -5,71 +5,36 @@ Check container logs for errors and warnings
 
 import sys
 import subprocess
-from pathlib import Path
+from typing import Iterator
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parent
-sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
-
-from theme import (  # noqa: E402
-    Colors, Icons, log_success, log_error, log_warn, log_info
+from _common import (
+    REPO_ROOT, Colors, Icons, log_success, log_error, log_warn, log_info,
+    load_env_config, container_exists
 )
 
 
-def load_env_config(repo_root: Path) -> dict:
-    """Load configuration from .env file"""
-    config = {
-        'SYS_DIR': 'sys',
-        'GITHUB_DIR': '.github',
-        'SCRIPT_DIRS': 'docker,dev,utils,rust',
-        'CONTAINER_NAME': 'your-container-name',
-        'IMAGE_NAME': 'your-image-name:latest',
-        'DISPLAY_NAME': 'Your Service',
-        'DOCKERFILE_PATH': './Dockerfile'
-    }
-
-    sys_env_dir = repo_root / config['SYS_DIR'] / 'env'
-    for env_name in ['.env', '.env.example']:
-        env_file = sys_env_dir / env_name
-        if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
-            break
-
-    return config
-
-
-def container_exists(name: str) -> bool:
-    """Check if container exists."""
-    try:
-        result = subprocess.run(
-            ['docker', 'ps', '-a', '--filter', f'name=^{name}$',
-             '--format', '{{.Names}}'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return name in result.stdout
-    except subprocess.CalledProcessError:
-        return False
-
-
-def get_logs(name: str, lines: int) -> str:
-    """Get container logs."""
+def iter_logs(name: str, lines: int) -> Iterator[str]:
+    """Stream the container log lines that mention ERROR or WARN."""
+    # grep drops the bulk of the log before it ever reaches Python
+    docker = subprocess.Popen(
+        ['docker', 'logs', '--tail', str(lines), name],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT
+    )
+    grep = subprocess.Popen(
+        ['grep', '-a', '-F', '-e', 'ERROR', '-e', 'WARN'],
+        stdin=docker.stdout,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    docker.stdout.close()
     try:
-        result = subprocess.run(
-            ['docker', 'logs', '--tail', str(lines), name],
-            capture_output=True,
-            text=True,
-            stderr=subprocess.STDOUT
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
-        return ""
+        for line in grep.stdout:
+            yield line.rstrip('\n')
+    finally:
+        grep.stdout.close()
+        grep.wait()
+        docker.wait()
 
 
 def main():
@@ -88,10 +53,14 @@ def main():
         log_error(f"Container '{container_name}' not found")
         sys.exit(1)
 
-    logs = get_logs(container_name, lines)
-
-    error_lines = [line for line in logs.split('\n') if 'ERROR' in line]
-    warn_lines = [line for line in logs.split('\n') if 'WARN' in line]
+    # Classify lines as they stream in (a line may be both)
+    error_lines = []
+    warn_lines = []
+    for line in iter_logs(container_name, lines):
+        if 'ERROR' in line:
+            error_lines.append(line)
+        if 'WARN' in line:
+            warn_lines.append(line)
 
     error_count = len(error_lines)
     warn_count = len(warn_lines)
@@ -109,15 +78,15 @@ def main():
     if error_count > 0:
         print(f"{Colors.RED}{Icons.CROSS}  Errors:{Colors.NC}")
         print()
-        for line in error_lines:
-            print(f"{Colors.SUBTEXT}  {Colors.RED}{line}{Colors.NC}")
+        prefix = f"{Colors.SUBTEXT}  {Colors.RED}"
+        print('\n'.join(f"{prefix}{line}{Colors.NC}" for line in error_lines))
         print()
 
     if warn_count > 0:
         print(f"{Colors.YELLOW}{Icons.WARN}  Warnings:{Colors.NC}")
         print()
-        for line in warn_lines:
-            print(f"{Colors.SUBTEXT}  {Colors.YELLOW}{line}{Colors.NC}")
+        prefix = f"{Colors.SUBTEXT}  {Colors.YELLOW}"
+        print('\n'.join(f"{prefix}{line}{Colors.NC}" for line in warn_lines))
         print()
 
     if error_count == 0 and warn_count == 0:
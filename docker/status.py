@@ -3,46 +3,36 @@
 Check the current status and stats of Docker container
 """
 
+import argparse
+import calendar
+import os
+import queue
 import sys
 import subprocess
-import json
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO, Optional, Tuple
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parent
-sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
-
-from theme import (  # noqa: E402
-    Colors, Icons, log_success, log_error, log_info
+from _common import (
+    REPO_ROOT, Colors, Icons, log_success, log_error, log_info,
+    load_env_config
 )
 
+# cgroup v2 hierarchy; containers live under the systemd or cgroupfs layout
+CGROUP_ROOT = Path('/sys/fs/cgroup')
+CGROUP_LAYOUTS = ('system.slice/docker-{id}.scope', 'docker/{id}')
 
-def load_env_config(repo_root: Path) -> dict:
-    """Load configuration from .env file"""
-    config = {
-        'SYS_DIR': 'sys',
-        'GITHUB_DIR': '.github',
-        'SCRIPT_DIRS': 'docker,dev,utils,rust',
-        'CONTAINER_NAME': 'your-container-name',
-        'IMAGE_NAME': 'your-image-name:latest',
-        'DISPLAY_NAME': 'Your Service',
-        'DOCKERFILE_PATH': './Dockerfile'
-    }
-
-    sys_env_dir = repo_root / config['SYS_DIR'] / 'env'
-    for env_name in ['.env', '.env.example']:
-        env_file = sys_env_dir / env_name
-        if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        config[key] = value
-            break
+# CPU usage window when reading the cgroup directly (docker stats takes ~1s)
+CPU_SAMPLE_SECONDS = 0.2
+
+BINARY_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB')
+
+STATS_FORMAT = '{{.MemUsage}}|{{.CPUPerc}}'
 
-    return config
+# Cursor home + clear screen, used to redraw the --watch dashboard
+CLEAR_SCREEN = '\033[H\033[2J'
 
 
 def log_stat(icon: str, label: str, value: str, color: str):
@@ -51,71 +41,140 @@ def log_stat(icon: str, label: str, value: str, color: str):
           f"{color}{value}{Colors.NC}")
 
 
-def container_exists(name: str) -> bool:
-    """Check if container exists."""
+def get_container_info(name: str) -> dict:
+    """Get container state fields ({} if the container does not exist)."""
+    # A Go template returns just the needed fields instead of the full
+    # multi-KB inspect document
     try:
         result = subprocess.run(
-            ['docker', 'ps', '-a', '--filter', f'name=^{name}$',
-             '--format', '{{.Names}}'],
+            ['docker', 'inspect', '--type', 'container', '--format',
+             '{{.State.Status}}|{{with .State.Health}}{{.Status}}{{end}}'
+             '|{{.State.StartedAt}}|{{.Id}}', name],
             capture_output=True,
             text=True,
             check=True
         )
-        return name in result.stdout
     except subprocess.CalledProcessError:
-        return False
+        return {}
+    parts = result.stdout.strip().split('|')
+    if len(parts) != 4:
+        return {}
+    return dict(zip(('Status', 'Health', 'StartedAt', 'Id'), parts))
 
 
-def is_running(name: str) -> bool:
-    """Check if container is running."""
+def docker_output(args: list) -> str:
+    """Run a docker command and return its stdout ('' on failure)."""
     try:
         result = subprocess.run(
-            ['docker', 'ps', '--filter', f'name=^{name}$',
-             '--filter', 'status=running'],
+            args,
             capture_output=True,
             text=True,
             check=True
         )
-        return name in result.stdout
+        return result.stdout
     except subprocess.CalledProcessError:
-        return False
+        return ''
+
+
+def parse_epoch(timestamp: str) -> int:
+    """Convert a UTC RFC 3339 timestamp to epoch seconds (fraction dropped)."""
+    # Fixed-width fields, so slicing avoids datetime and timezone parsing
+    # (and the nanosecond fraction docker emits needs no special handling)
+    return calendar.timegm((
+        int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+        int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+    ))
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count the way docker stats does (e.g. 12.5MiB)."""
+    unit = 0
+    while size >= 1024 and unit < len(BINARY_UNITS) - 1:
+        size /= 1024
+        unit += 1
+    return f"{size:.4g}{BINARY_UNITS[unit]}"
+
+
+def find_cgroup(container_id: str) -> Optional[Path]:
+    """Locate the container's cgroup v2 directory (None if not available)."""
+    for layout in CGROUP_LAYOUTS:
+        cgroup = CGROUP_ROOT / layout.format(id=container_id)
+        if (cgroup / 'cpu.stat').is_file():
+            return cgroup
+    return None
+
+
+def read_cpu_usec(cgroup: Path) -> int:
+    """Read the total CPU time used by a cgroup in microseconds."""
+    for line in (cgroup / 'cpu.stat').read_text().splitlines():
+        key, _, value = line.partition(' ')
+        if key == 'usage_usec':
+            return int(value)
+    raise ValueError('usage_usec missing from cpu.stat')
+
+
+def cgroup_stats(cgroup: Path) -> str:
+    """Read memory and CPU usage from the cgroup as 'MemUsage|CPUPerc'."""
+    cpu_start = read_cpu_usec(cgroup)
+    time_start = time.monotonic()
+    time.sleep(CPU_SAMPLE_SECONDS)
+    cpu_used = read_cpu_usec(cgroup) - cpu_start
+    elapsed = time.monotonic() - time_start
+
+    # Like docker stats, page cache that can be reclaimed is not counted
+    memory = int((cgroup / 'memory.current').read_text())
+    for line in (cgroup / 'memory.stat').read_text().splitlines():
+        key, _, value = line.partition(' ')
+        if key == 'inactive_file':
+            memory -= int(value)
+            break
 
+    limit = (cgroup / 'memory.max').read_text().strip()
+    if limit == 'max':
+        limit = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+    cpu_percent = cpu_used / (elapsed * 1e6) * 100
+    return (f"{format_bytes(memory)} / {format_bytes(int(limit))}"
+            f"|{cpu_percent:.2f}%")
+
+
+def container_stats(name: str, container_id: str) -> str:
+    """Get 'MemUsage|CPUPerc' for a running container."""
+    # Reading the cgroup skips the docker stats fork and its ~1s sample
+    cgroup = find_cgroup(container_id)
+    if cgroup:
+        try:
+            return cgroup_stats(cgroup)
+        except (OSError, ValueError):
+            pass
+    return docker_output(['docker', 'stats', '--no-stream',
+                          '--format', STATS_FORMAT, name])
 
-def get_container_info(name: str) -> dict:
-    """Get container information."""
-    try:
-        result = subprocess.run(
-            ['docker', 'inspect', name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        data = json.loads(result.stdout)
-        return data[0] if data else {}
-    except (subprocess.CalledProcessError, json.JSONDecodeError, IndexError):
-        return {}
 
+def fetch_live_data(name: str, info: dict) -> Tuple[str, str]:
+    """Get (stats, ports) output for a running container."""
+    # Stats are sampled over a time window; query ports alongside it
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stats_future = executor.submit(container_stats, name, info['Id'])
+        ports_future = executor.submit(docker_output,
+                                       ['docker', 'port', name])
+    return stats_future.result(), ports_future.result()
 
-def show_container_status(name: str, display_name: str, icon: str):
-    """Show detailed container status."""
+
+def show_container_status(name: str, display_name: str, icon: str,
+                          info: dict,
+                          live: Optional[Tuple[str, str]] = None):
+    """Show detailed container status (live: prefetched stats and ports)."""
     print(f"{Colors.MAUVE}{icon}  {display_name}{Colors.NC}")
     print()
 
-    if not container_exists(name):
-        log_error(f"Container not found: {name}")
-        print()
-        return False
-
-    info = get_container_info(name)
     if not info:
         log_error("Failed to get container info")
         print()
         return False
 
-    state = info.get('State', {})
-    status = state.get('Status', 'unknown')
-    health_info = state.get('Health', {})
-    health = health_info.get('Status', 'none')
+    status = info['Status'] or 'unknown'
+    health = info['Health'] or 'none'
 
     if status == 'running':
         log_stat(Icons.STATUS, "Status:", status, Colors.GREEN)
@@ -131,14 +190,12 @@ def show_container_status(name: str, display_name: str, icon: str):
             log_stat(Icons.WARN, "Health:", health, Colors.YELLOW)
 
     if status == 'running':
-        started_str = state.get('StartedAt', '')
+        stats, ports = live if live else fetch_live_data(name, info)
+
+        started_str = info['StartedAt']
         if started_str:
             try:
-                started = datetime.fromisoformat(
-                    started_str.replace('Z', '+00:00')
-                )
-                now = datetime.now(started.tzinfo)
-                diff = int((now - started).total_seconds())
+                diff = int(time.time()) - parse_epoch(started_str)
 
                 days = diff // 86400
                 hours = (diff % 86400) // 3600
@@ -155,67 +212,138 @@ def show_container_status(name: str, display_name: str, icon: str):
             except Exception:
                 pass
 
-        try:
-            result = subprocess.run(
-                ['docker', 'stats', '--no-stream',
-                 '--format', '{{.MemUsage}}|{{.CPUPerc}}', name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if result.stdout:
-                parts = result.stdout.strip().split('|')
-                if len(parts) == 2:
-                    log_stat(Icons.MEM, "Memory:", parts[0], Colors.YELLOW)
-                    log_stat(Icons.CPU, "CPU:", parts[1], Colors.BLUE)
-        except subprocess.CalledProcessError:
-            pass
+        if stats:
+            parts = stats.strip().split('|')
+            if len(parts) == 2:
+                log_stat(Icons.MEM, "Memory:", parts[0], Colors.YELLOW)
+                log_stat(Icons.CPU, "CPU:", parts[1], Colors.BLUE)
 
-        try:
-            result = subprocess.run(
-                ['docker', 'port', name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if result.stdout:
-                print(f"{Colors.SUBTEXT}{Icons.NET}  Ports:{Colors.NC}")
-                for line in result.stdout.strip().split('\n'):
-                    line = line.replace('0.0.0.0:', '')
-                    print(f"{Colors.SAPPHIRE}                    {line}"
-                          f"{Colors.NC}")
-        except subprocess.CalledProcessError:
-            pass
+        if ports:
+            print(f"{Colors.SUBTEXT}{Icons.NET}  Ports:{Colors.NC}")
+            for line in ports.strip().split('\n'):
+                line = line.replace('0.0.0.0:', '')
+                print(f"{Colors.SAPPHIRE}                    {line}"
+                      f"{Colors.NC}")
 
     print()
     return True
 
 
+def show_summary(info: dict):
+    """Show the running / not running verdict."""
+    if info['Status'] == 'running':
+        log_success("Container is running")
+    else:
+        log_error("Container is not running")
+        print()
+        log_info(f"Start container with: {Colors.BLUE}./start.py{Colors.NC}")
+
+    print()
+
+
+def forward_lines(stream: IO[str], kind: str, updates: queue.Queue):
+    """Push each line of a streaming docker command onto the update queue."""
+    for line in stream:
+        updates.put((kind, line))
+    updates.put((kind, None))
+
+
+def watch_container(name: str, display_name: str):
+    """Redraw the status whenever docker reports an event or new stats."""
+    # Both commands stream; nothing is polled. Events trigger a fresh
+    # inspect, and stats are pushed by the daemon about once a second
+    events = subprocess.Popen(
+        ['docker', 'events', '--filter', 'type=container',
+         '--filter', f'container={name}', '--format', '{{.Action}}'],
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    stats = subprocess.Popen(
+        ['docker', 'stats', '--format', STATS_FORMAT, name],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+
+    updates = queue.Queue()
+    for kind, proc in (('event', events), ('stats', stats)):
+        threading.Thread(target=forward_lines,
+                         args=(proc.stdout, kind, updates),
+                         daemon=True).start()
+
+    info = get_container_info(name)
+    ports = docker_output(['docker', 'port', name]) if info else ''
+    latest_stats = ''
+    clear_screen = CLEAR_SCREEN if sys.stdout.isatty() else ''
+
+    try:
+        while True:
+            print(clear_screen, end='')
+            print(f"{Colors.MAUVE}[status]{Colors.NC} {Icons.DOCKER}  "
+                  f"Watching {name} container (Ctrl+C to stop)...")
+            print()
+
+            if info:
+                show_container_status(name, display_name, Icons.SERVER,
+                                      info, (latest_stats, ports))
+                show_summary(info)
+            else:
+                log_error(f"{name} container not found")
+                print()
+            sys.stdout.flush()
+
+            kind, line = updates.get()
+            if line is None:
+                if kind == 'event':
+                    break
+                continue
+            if kind == 'event':
+                info = get_container_info(name)
+                ports = docker_output(['docker', 'port', name]) if info else ''
+            else:
+                # Each stats frame starts with its own clear-screen codes
+                latest_stats = line.rsplit('\033[H', 1)[-1].strip()
+    except KeyboardInterrupt:
+        print()
+    finally:
+        events.terminate()
+        stats.terminate()
+
+
 def main():
     """Main execution."""
+    parser = argparse.ArgumentParser(
+        description='Check the current status and stats of Docker container'
+    )
+    parser.add_argument(
+        '-w', '--watch',
+        action='store_true',
+        help='Keep the status on screen, updated from docker events and '
+             'streaming stats'
+    )
+    args = parser.parse_args()
+
     config = load_env_config(REPO_ROOT)
     container_name = config['CONTAINER_NAME']
     display_name = config['DISPLAY_NAME']
 
+    if args.watch:
+        watch_container(container_name, display_name)
+        return
+
     print(f"{Colors.MAUVE}[status]{Colors.NC} {Icons.DOCKER}  "
           f"Checking {container_name} container status...")
     print()
 
-    if not container_exists(container_name):
+    # One inspect answers existence, state, health and uptime
+    info = get_container_info(container_name)
+    if not info:
         log_error(f"{container_name} container not found")
         print()
         sys.exit(1)
 
-    show_container_status(container_name, display_name, Icons.SERVER)
-
-    if is_running(container_name):
-        log_success("Container is running")
-    else:
-        log_error("Container is not running")
-        print()
-        log_info(f"Start container with: {Colors.BLUE}./start.py{Colors.NC}")
-
-    print()
+    show_container_status(container_name, display_name, Icons.SERVER, info)
+    show_summary(info)
 
 
 if __name__ == '__main__':
@@ -13,7 +13,7 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
-from theme import Colors, Icons, log_success, log_error, log_warn, log_info
+from theme import Colors, Icons, log_success, log_error, log_warn, log_info, parse_env_file
 
 
 def load_env_config(repo_root: Path) -> dict:
@@ -23,14 +23,11 @@ def load_env_config(repo_root: Path) -> dict:
     if not env_file.exists():
         raise FileNotFoundError(f"config not found: {env_file}")
 
-    config = {}
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                value = value.strip('"').strip("'")
-                config[key] = value
+    # Remove quotes if present
+    config = {
+        key: value.strip('"').strip("'")
+        for key, value in parse_env_file(env_file).items()
+    }
 
     return config
 
@@ -4,8 +4,12 @@ Interactive installation script for helper scripts
 Copies scripts and customizes them for a new project
 """
 
-import sys
+import filecmp
+import os
 import re
+import shutil
+import stat
+import sys
 from pathlib import Path
 from typing import List, Tuple
 
@@ -13,9 +17,33 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(SCRIPT_DIR / 'sys' / 'theme'))
 
 from theme import (  # noqa: E402
-    Colors, Icons, log_success, log_error, log_warn, log_info, log_header
+    Colors, Icons, log_success, log_error, log_warn, log_info, log_header,
+    format_header, parse_env_file
+)
+
+# Placeholder values in the shipped scripts, replaced during install
+PLACEHOLDERS = {
+    'CONTAINER_NAME': 'your-container-name',
+    'IMAGE_NAME': 'your-image-name:latest',
+    'DISPLAY_NAME': 'Your Service',
+    'DOCKERFILE_PATH': './Dockerfile',
+}
+
+# One pass over the script for all placeholders
+PLACEHOLDER_PATTERN = re.compile(
+    r'readonly (' + '|'.join(PLACEHOLDERS) + r')="([^"]*)"'
+)
+
+# '# ' comments to the end of the line, in one pass over the whole script.
+# Shebang lines are captured and written back; a '#' with nothing after it
+# takes its newline along
+INLINE_COMMENT_PATTERN = re.compile(
+    r'^([^\S\n]*#!.*)|[^\S\n]*#(?:[^\S\n]*\n|[^\S\n]+.*)', re.MULTILINE
 )
 
+# Whitespace-only lines running to the end of the file
+TRAILING_BLANK_LINES_PATTERN = re.compile(r'(?:^|(?<=\n))\s*\Z')
+
 
 class Config:
     """Configuration class for environment variables."""
@@ -28,12 +56,8 @@ class Config:
         """Load environment configuration from sys/env/.env."""
         env_path = SCRIPT_DIR / self.sys_dir / 'env' / '.env'
         if env_path.exists():
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        setattr(self, key.lower(), value)
+            for key, value in parse_env_file(env_path).items():
+                setattr(self, key.lower(), value)
 
 
 def prompt(prompt_text: str, default_value: str = "") -> str:
@@ -63,9 +87,11 @@ def get_script_description(file: Path) -> str:
     """Extract description from line 2 of script file."""
     try:
         with open(file, 'r') as f:
-            lines = f.readlines()
-            if len(lines) >= 2:
-                desc = lines[1].strip()
+            # Only line 2 matters; stop reading there
+            next(f, None)
+            second = next(f, None)
+            if second is not None:
+                desc = second.strip()
                 if desc.startswith('#') or desc.startswith('"""') or desc.startswith("'''"):
                     desc = desc.lstrip('#"\'').strip()
                     if desc:
@@ -82,10 +108,16 @@ def scan_available_scripts() -> List[Tuple[str, str]]:
     for directory in ['docker', 'dev', 'utils']:
         dir_path = SCRIPT_DIR / directory
         if dir_path.exists():
-            for script in sorted(dir_path.iterdir()):
-                if script.is_file() and (script.suffix in ['.sh', '.py']):
-                    relative_path = f"{directory}/{script.name}"
-                    desc = get_script_description(script)
+            # DirEntry caches the file type from the directory read
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+            for entry in entries:
+                # Underscore modules are shared helpers, not scripts
+                if entry.name.startswith('_'):
+                    continue
+                if entry.name.endswith(('.sh', '.py')) and entry.is_file():
+                    relative_path = f"{directory}/{entry.name}"
+                    desc = get_script_description(Path(entry.path))
                     scripts.append((relative_path, desc))
 
     return scripts
@@ -98,18 +130,21 @@ def select_scripts() -> List[str]:
 
     scripts = scan_available_scripts()
 
-    print(f"{Colors.TEXT}Available scripts:{Colors.NC}")
-    print()
-
-    for i, (script, desc) in enumerate(scripts, 1):
-        print(f"{Colors.SUBTEXT}  {i:2d}){Colors.NC} {script:30s} {Colors.SUBTEXT}{desc}{Colors.NC}")
-
-    print()
-    print(f"{Colors.TEXT}Select scripts to install:{Colors.NC}")
-    print(f"{Colors.SUBTEXT}  - Enter numbers separated by spaces (e.g., 1 2 3){Colors.NC}")
-    print(f"{Colors.SUBTEXT}  - Enter 'all' for all scripts{Colors.NC}")
-    print(f"{Colors.SUBTEXT}  - Enter 'core' for core scripts (start, stop, status, logs){Colors.NC}")
-    print()
+    # The menu is rendered in one write rather than one per line
+    lines = [f"{Colors.TEXT}Available scripts:{Colors.NC}", ""]
+    lines.extend(
+        f"{Colors.SUBTEXT}  {i:2d}){Colors.NC} {script:30s} {Colors.SUBTEXT}{desc}{Colors.NC}"
+        for i, (script, desc) in enumerate(scripts, 1)
+    )
+    lines.extend([
+        "",
+        f"{Colors.TEXT}Select scripts to install:{Colors.NC}",
+        f"{Colors.SUBTEXT}  - Enter numbers separated by spaces (e.g., 1 2 3){Colors.NC}",
+        f"{Colors.SUBTEXT}  - Enter 'all' for all scripts{Colors.NC}",
+        f"{Colors.SUBTEXT}  - Enter 'core' for core scripts (start, stop, status, logs){Colors.NC}",
+        "",
+    ])
+    print('\n'.join(lines))
 
     selection = input("   > ").strip()
     selected = []
@@ -137,21 +172,19 @@ def remove_inline_comments(file_path: Path):
     """Remove inline comments from script file."""
     try:
         with open(file_path, 'r') as f:
-            lines = f.readlines()
+            content = f.read()
 
-        cleaned_lines = []
-        for line in lines:
-            if line.strip().startswith('#!'):
-                cleaned_lines.append(line)
-            else:
-                line = re.sub(r'\s*#\s+.*$', '', line)
-                cleaned_lines.append(line)
+        content = INLINE_COMMENT_PATTERN.sub(r'\1', content)
 
-        while len(cleaned_lines) > 1 and cleaned_lines[-1].strip() == '' and cleaned_lines[-2].strip() == '':
-            cleaned_lines.pop()
+        # Keep at most one blank line at the end of the file
+        match = TRAILING_BLANK_LINES_PATTERN.search(content)
+        if match:
+            end = content.find('\n', match.start())
+            if end != -1:
+                content = content[:end + 1]
 
         with open(file_path, 'w') as f:
-            f.writelines(cleaned_lines)
+            f.write(content)
     except Exception as e:
         log_warn(f"Could not remove comments from {file_path.name}: {e}")
 
@@ -163,19 +196,20 @@ def customize_script(file_path: Path, container_name: str, image_name: str,
         with open(file_path, 'r') as f:
             content = f.read()
 
-        replacements = {
-            r'readonly CONTAINER_NAME="your-container-name"':
-                f'readonly CONTAINER_NAME="{container_name}"',
-            r'readonly IMAGE_NAME="your-image-name:latest"':
-                f'readonly IMAGE_NAME="{image_name}"',
-            r'readonly DISPLAY_NAME="Your Service"':
-                f'readonly DISPLAY_NAME="{display_name}"',
-            r'readonly DOCKERFILE_PATH="./Dockerfile"':
-                f'readonly DOCKERFILE_PATH="{dockerfile_path}"',
+        values = {
+            'CONTAINER_NAME': container_name,
+            'IMAGE_NAME': image_name,
+            'DISPLAY_NAME': display_name,
+            'DOCKERFILE_PATH': dockerfile_path,
         }
 
-        for pattern, replacement in replacements.items():
-            content = re.sub(pattern, replacement, content)
+        def replace_placeholder(match):
+            name, value = match.groups()
+            if value != PLACEHOLDERS[name]:
+                return match.group(0)
+            return f'readonly {name}="{values[name]}"'
+
+        content = PLACEHOLDER_PATTERN.sub(replace_placeholder, content)
 
         with open(file_path, 'w') as f:
             f.write(content)
@@ -183,6 +217,21 @@ def customize_script(file_path: Path, container_name: str, image_name: str,
         log_warn(f"Could not customize {file_path.name}: {e}")
 
 
+def same_content(source: Path, target: Path) -> bool:
+    """Check whether target already holds exactly the bytes of source."""
+    try:
+        # Sizes are compared first, contents only when they match
+        return filecmp.cmp(source, target, shallow=False)
+    except OSError:
+        return False
+
+
+def copy_if_changed(source: Path, target: Path):
+    """Copy source to target, leaving an identical target untouched."""
+    if not same_content(source, target):
+        shutil.copyfile(source, target)
+
+
 def deploy_theme(target_dir: Path) -> bool:
     """Deploy theme.sh to target directory."""
     log_info("Deploying theme files (required for all scripts)...")
@@ -195,7 +244,7 @@ def deploy_theme(target_dir: Path) -> bool:
     if theme_sh.exists():
         target_sh = target_dir / 'theme.sh'
         try:
-            target_sh.write_text(theme_sh.read_text())
+            copy_if_changed(theme_sh, target_sh)
             target_sh.chmod(0o755)
             log_success("  Deployed: theme.sh")
         except Exception as e:
@@ -208,7 +257,7 @@ def deploy_theme(target_dir: Path) -> bool:
     if theme_py.exists():
         target_py = target_dir / 'theme.py'
         try:
-            target_py.write_text(theme_py.read_text())
+            copy_if_changed(theme_py, target_py)
             target_py.chmod(0o755)
             log_success("  Deployed: theme.py")
         except Exception as e:
@@ -221,6 +270,21 @@ def deploy_theme(target_dir: Path) -> bool:
     return success
 
 
+def deploy_docker_common(target_dir: Path) -> bool:
+    """Deploy _common.py, the module shared by the Docker scripts."""
+    common_py = SCRIPT_DIR / 'docker' / '_common.py'
+    target_common = target_dir / '_common.py'
+    try:
+        copy_if_changed(common_py, target_common)
+        log_success("  Deployed: _common.py")
+        print()
+        return True
+    except Exception as e:
+        log_warn(f"  Failed to deploy _common.py: {e}")
+        print()
+        return False
+
+
 def main():
     """Main installation function."""
     print()
@@ -289,6 +353,9 @@ def main():
 
     deploy_theme(target_dir)
 
+    if any(script.startswith('docker/') for script in selected_scripts):
+        deploy_docker_common(target_dir)
+
     deployed = 0
     failed = 0
 
@@ -297,18 +364,38 @@ def main():
         script_name = source_file.name
         target_file = target_dir / script_name
 
-        if not source_file.exists():
+        try:
+            source_mode = os.stat(source_file).st_mode
+        except OSError:
+            source_mode = 0
+
+        if not stat.S_ISREG(source_mode):
             log_error(f"Source file not found: {script}")
             failed += 1
             continue
 
-        if target_file.exists():
+        # One stat tells whether the target exists and what mode it has
+        try:
+            target_mode = stat.S_IMODE(os.stat(target_file).st_mode)
+        except FileNotFoundError:
+            target_mode = None
+
+        # Python scripts are deployed verbatim, so an identical target is
+        # already up to date and needs neither a prompt nor a rewrite
+        if (target_mode == 0o755 and script_name.endswith('.py')
+                and same_content(source_file, target_file)):
+            log_success(f"  Up to date: {script_name}")
+            deployed += 1
+            continue
+
+        if target_mode is not None:
             if not prompt_yes_no(f"  File exists: {script_name}. Overwrite?", "n"):
                 log_warn(f"  Skipped: {script_name}")
                 continue
 
         try:
-            target_file.write_text(source_file.read_text())
+            # Copied as bytes, streamed without a decoded in-memory copy
+            shutil.copyfile(source_file, target_file)
 
             if script_name.endswith('.sh'):
                 remove_inline_comments(target_file)
@@ -319,7 +406,9 @@ def main():
                     display_name, dockerfile_path
                 )
 
-            target_file.chmod(0o755)
+            # copyfile keeps the mode of a file it overwrites
+            if target_mode != 0o755:
+                target_file.chmod(0o755)
 
             log_success(f"  Deployed: {script_name}")
             deployed += 1
@@ -341,16 +430,18 @@ def main():
     log_info(f"Scripts installed to: {Colors.SAPPHIRE}{target_dir}{Colors.NC}")
     print()
 
-    log_header("Next Steps")
-    print()
-    print(f"{Colors.TEXT}1. Review the installed scripts:{Colors.NC}")
-    print(f"   {Colors.SUBTEXT}cd {target_dir}{Colors.NC}")
-    print()
-    print(f"{Colors.TEXT}2. Test the scripts:{Colors.NC}")
-    print(f"   {Colors.SUBTEXT}./status.sh{Colors.NC}")
-    print()
-    print(f"{Colors.TEXT}3. Customize further if needed{Colors.NC}")
-    print()
+    print('\n'.join([
+        format_header("Next Steps"),
+        "",
+        f"{Colors.TEXT}1. Review the installed scripts:{Colors.NC}",
+        f"   {Colors.SUBTEXT}cd {target_dir}{Colors.NC}",
+        "",
+        f"{Colors.TEXT}2. Test the scripts:{Colors.NC}",
+        f"   {Colors.SUBTEXT}./status.sh{Colors.NC}",
+        "",
+        f"{Colors.TEXT}3. Customize further if needed{Colors.NC}",
+        "",
+    ]))
 
     if any('rebuild.sh' in s for s in selected_scripts):
         log_warn("Remember to customize the docker run command in rebuild.sh")
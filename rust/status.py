@@ -15,7 +15,7 @@ sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'utils'))
 
 from theme import (  # noqa: E402
-    Colors, Icons, log_success, log_error, log_info
+    Colors, Icons, log_success, log_error, log_info, parse_env_file
 )
 from xdg_paths import get_log_file, get_pid_file  # noqa: E402
 
@@ -30,15 +30,11 @@ def load_env_config(repo_root: Path) -> dict:
             f"Copy sys/env/.env.example to sys/env/.env and configure it."
         )
 
-    config = {}
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                config[key] = value
+    # Remove quotes if present
+    config = {
+        key: value.strip('"').strip("'")
+        for key, value in parse_env_file(env_file).items()
+    }
 
     # Validate required keys
     required_keys = ['SERVER_BINARY', 'DISPLAY_NAME', 'SERVER_HOST', 'SERVER_PORT']
@@ -5,6 +5,11 @@ STYLECHECK_IGNORE - Python module, no shebang needed
 PYLINTCHECK_IGNORE - Theme module, different formatting standards
 """
 
+import functools
+import os
+import re
+import sys
+
 # Catppuccin Mocha color palette (24-bit true color)
 
 
@@ -21,6 +26,13 @@ class Colors:
     NC = '\033[0m'                         # No Color / Reset
 
 
+# Escape codes are wasted bytes when output is piped or NO_COLOR is set
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+    del _name
+
+
 # Nerd Font Icons
 
 
@@ -51,27 +63,73 @@ class Icons:
     STATUS = '\uf05a'     #
 
 
+def format_success(msg: str) -> str:
+    """Format success message with [tag]"""
+    return f"[success] {Colors.GREEN}{Icons.CHECK}  {Colors.NC}{msg}"
+
+
+def format_error(msg: str) -> str:
+    """Format error message with [tag]"""
+    return f"[error] {Colors.RED}{Icons.CROSS}  {Colors.NC}{msg}"
+
+
+def format_warn(msg: str) -> str:
+    """Format warning message with [tag]"""
+    return f"[warn] {Colors.YELLOW}{Icons.WARN}  {Colors.NC}{msg}"
+
+
+def format_info(msg: str) -> str:
+    """Format info message with [tag]"""
+    return f"[info] {Colors.BLUE}{Icons.INFO}  {Colors.NC}{msg}"
+
+
+def format_header(msg: str) -> str:
+    """Format header message"""
+    return f"{Colors.MAUVE}{msg}{Colors.NC}"
+
+
 def log_success(msg: str):
     """Log success message with [tag]"""
-    print(f"[success] {Colors.GREEN}{Icons.CHECK}  {Colors.NC}{msg}")
+    print(format_success(msg))
 
 
 def log_error(msg: str):
     """Log error message with [tag]"""
-    import sys
-    print(f"[error] {Colors.RED}{Icons.CROSS}  {Colors.NC}{msg}", file=sys.stderr)
+    print(format_error(msg), file=sys.stderr)
 
 
 def log_warn(msg: str):
     """Log warning message with [tag]"""
-    print(f"[warn] {Colors.YELLOW}{Icons.WARN}  {Colors.NC}{msg}")
+    print(format_warn(msg))
 
 
 def log_info(msg: str):
     """Log info message with [tag]"""
-    print(f"[info] {Colors.BLUE}{Icons.INFO}  {Colors.NC}{msg}")
+    print(format_info(msg))
 
 
 def log_header(msg: str):
     """Log header message"""
-    print(f"{Colors.MAUVE}{msg}{Colors.NC}")
+    print(format_header(msg))
+
+
+# Shared .env parsing
+
+
+# KEY=VALUE per line: surrounding whitespace is trimmed, the key runs up to
+# the first '=', and lines starting with '#' (comments) never match
+ENV_LINE_PATTERN = re.compile(r'^[^\S\n]*((?:[^#=\s][^=\n]*)?)=([^\n]*?)[^\S\n]*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_env_file(path: str, mtime_ns: int) -> dict:
+    """Parse KEY=VALUE lines of a .env file (cached per path and mtime)"""
+    with open(path, 'r') as f:
+        text = f.read()
+    return dict(ENV_LINE_PATTERN.findall(text))
+
+
+def parse_env_file(env_file) -> dict:
+    """Load a .env file as a dict, reparsing only when the file changes"""
+    path = os.fspath(env_file)
+    return dict(_parse_env_file(path, os.stat(path).st_mtime_ns))
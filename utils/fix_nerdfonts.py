@@ -4,9 +4,14 @@ Nerd Font Icon Fixer for Shell Scripts
 Replaces empty icon strings with correct Nerd Font Unicode characters
 """
 
+import os
+import stat
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Iterator, List, Tuple
 
 # Add sys/theme to path for central theming
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -14,7 +19,10 @@ REPO_ROOT = SCRIPT_DIR.parent.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 # Import central theme
-from theme import Colors, Icons, log_success, log_error, log_warn, log_info
+from theme import (
+    Colors, Icons, log_error, log_warn, log_info, log_success,
+    format_error, format_success, format_warn, parse_env_file
+)
 
 
 def load_env_config(repo_root: Path) -> dict:
@@ -24,100 +32,53 @@ def load_env_config(repo_root: Path) -> dict:
     if not env_file.exists():
         raise FileNotFoundError(f"config not found: {env_file}")
 
-    config = {}
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                config[key] = value
+    # Remove quotes if present
+    config = {
+        key: value.strip('"').strip("'")
+        for key, value in parse_env_file(env_file).items()
+    }
 
     return config
 
 
-# Nerd Font Icon mappings (Unicode codepoints)
+# Nerd Font Icon mappings (Unicode codepoints), taken from the central theme
 NERD_FONTS = {
-    'CHECK': Icons.CHECK,
-    'CROSS': Icons.CROSS,
-    'WARN': Icons.WARN,
-    'INFO': Icons.INFO,
-    'SERVER': Icons.SERVER,
-    'DOCKER': Icons.DOCKER,
-    'CONTAINER': Icons.CONTAINER,
-    'CHART': Icons.CHART,
-    'CLOCK': Icons.CLOCK,
-    'MEM': Icons.MEM,
-    'CPU': Icons.CPU,
-    'NET': Icons.NET,
-    'LOG': Icons.LOG,
-    'FILE': Icons.FILE,
-    'DATABASE': Icons.DATABASE,
-    'PLAY': Icons.PLAY,
-    'STOP': Icons.STOP,
-    'RESTART': Icons.RESTART,
-    'STATUS': Icons.STATUS,
+    name: getattr(Icons, name)
+    for name in (
+        'CHECK', 'CROSS', 'WARN', 'INFO', 'SERVER', 'DOCKER', 'CONTAINER',
+        'CHART', 'CLOCK', 'MEM', 'CPU', 'NET', 'LOG', 'FILE', 'DATABASE',
+        'PLAY', 'STOP', 'RESTART', 'STATUS',
+    )
 }
 
-def get_patterns_for_filetype(filepath: Path, icon_name: str) -> list:
-    """
-    Get appropriate regex patterns based on file extension
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 32
 
-    Args:
-        filepath: Path to the file
-        icon_name: Name of the icon (e.g., 'CHECK', 'WARN')
+# Icon names are ASCII, so files are matched and fixed as bytes; only the
+# replacement text needs encoding, and that is done once here
+ICON_REPLACEMENTS = {
+    name.encode(): f'{name}="{icon}"'.encode('utf-8')
+    for name, icon in NERD_FONTS.items()
+}
 
-    Returns:
-        List of (pattern, description) tuples to try in order
-    """
-    suffix = filepath.suffix.lower()
-    patterns = []
-
-    if suffix == '.sh':
-        # Shell scripts: readonly ICON=""
-        patterns.append((
-            rf'(readonly\s+{icon_name}=)""\s*$',
-            'shell readonly'
-        ))
-    elif suffix in ['.yml', '.yaml']:
-        # YAML files: ICON="" (no readonly, used in GitHub Actions)
-        patterns.append((
-            rf'(\s+{icon_name}=)""\s*$',
-            'yaml assignment'
-        ))
-    elif suffix == '.py':
-        # Python: ICON = "" (with spaces around =)
-        patterns.append((
-            rf'({icon_name}\s*=\s*)""\s*$',
-            'python assignment'
-        ))
-    elif suffix == '.md':
-        # Markdown: Could have various patterns
-        # - Code blocks with readonly ICON=""
-        # - Inline code `ICON=""`
-        patterns.append((
-            rf'(readonly\s+{icon_name}=)""\s*$',
-            'markdown shell code'
-        ))
-        patterns.append((
-            rf'(`{icon_name}=)""`',
-            'markdown inline code'
-        ))
-    else:
-        # Generic: try common patterns
-        patterns.append((
-            rf'(readonly\s+{icon_name}=)""\s*$',
-            'generic readonly'
-        ))
-        patterns.append((
-            rf'({icon_name}=)""\s*$',
-            'generic assignment'
-        ))
-
-    return patterns
-
-def fix_icons_in_file(filepath: Path, dry_run: bool = False) -> bool:
+# One alternation over all icon names, so each file is scanned once.
+# As in the per-icon passes this replaces, an icon with a readonly
+# assignment only has those fixed; other icons have every NAME="" fixed,
+# including names that merely end in the icon name (MY_CHECK="")
+ICON_NAMES = b'|'.join(map(re.escape, ICON_REPLACEMENTS))
+READONLY_ICON_PATTERN = re.compile(
+    rb'readonly\s+(' + ICON_NAMES + rb')\s*=\s*""\s*$',
+    re.MULTILINE
+)
+ICON_PATTERN = re.compile(
+    rb'(readonly\s+)?(' + ICON_NAMES + rb')\s*=\s*""\s*$',
+    re.MULTILINE
+)
+
+# Runs of spaces collapsed by the whitespace normalization
+MULTISPACE_PATTERN = re.compile(rb' {2,}')
+
+def fix_icons_in_file(filepath: Path, dry_run: bool = False) -> Tuple[bool, List[Tuple[bool, str]]]:
     """
     Fix Nerd Font icons in a file based on file type
 
@@ -126,75 +87,94 @@ def fix_icons_in_file(filepath: Path, dry_run: bool = False) -> bool:
         dry_run: If True, only show what would be changed
 
     Returns:
-        True if changes were made, False otherwise
+        (changes made, log lines as (is_error, message) pairs); the log
+        is returned rather than printed so worker processes stay quiet
     """
+    messages = []
     try:
-        content = filepath.read_text(encoding='utf-8')
-        original_content = content
-        changes_made = False
-
-        # Pattern to match: readonly ICON_NAME=""
-        # We'll replace the empty string with the actual icon
-        for icon_name, icon_char in NERD_FONTS.items():
-            # Match patterns like: readonly CHECK=""
-            # Updated patterns to handle variable whitespace around =
-            # Pattern 1: With readonly (shell scripts)
-            pattern1 = rf'(readonly\s+{icon_name})\s*=\s*""\s*$'
-            # Pattern 2: Without readonly (YAML, other formats)
-            pattern2 = rf'({icon_name})\s*=\s*""\s*$'
-            # Replacement with normalized spacing (no spaces around =)
-            replacement = rf'\1="{icon_char}"'
-
-            # Try pattern 1 first (with readonly)
-            new_content = re.sub(pattern1, replacement, content, flags=re.MULTILINE)
-
-            # If no changes, try pattern 2 (without readonly)
-            if new_content == content:
-                new_content = re.sub(pattern2, replacement, content, flags=re.MULTILINE)
-
-            if new_content != content:
-                changes_made = True
+        data = filepath.read_bytes()
+
+        # Every fix replaces an empty "" value; files without one are
+        # skipped before any decoding or regex work
+        if b'""' not in data:
+            return False, messages
+
+        # Universal newlines, as read_text() would give
+        content = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+        # Replace ICON_NAME="" with the actual icon, normalizing spacing
+        # (no spaces around =)
+        fixed_icons = set()
+
+        readonly_icons = (
+            set(READONLY_ICON_PATTERN.findall(content)) if b'readonly' in content else set()
+        )
+
+        def replace_icon(match):
+            readonly, icon_name = match.groups()
+            if readonly is None and icon_name in readonly_icons:
+                return match.group(0)
+            fixed_icons.add(icon_name.decode())
+            return (readonly or b'') + ICON_REPLACEMENTS[icon_name]
+
+        content = ICON_PATTERN.sub(replace_icon, content)
+        changes_made = bool(fixed_icons)
+
+        for icon_name in NERD_FONTS:
+            if icon_name in fixed_icons:
                 if not dry_run:
-                    log_success(f"Fixed {icon_name} in {filepath.name}")
+                    messages.append((False, format_success(f"Fixed {icon_name} in {filepath.name}")))
                 else:
-                    log_warn(f"Would fix {icon_name} in {filepath.name}")
-                content = new_content
+                    messages.append((False, format_warn(f"Would fix {icon_name} in {filepath.name}")))
 
         # Normalize whitespace after icon fixes
         if changes_made:
-            lines = content.split('\n')
+            lines = content.split(b'\n')
             normalized_lines = []
 
             for line in lines:
-                # Preserve leading whitespace (indentation)
-                leading_ws = ''
+                # Only lines with a run of spaces after the indentation change;
+                # the rest are kept as they are, with no slicing or joining
                 stripped = line.lstrip()
-                if stripped != line:
-                    leading_ws = line[:len(line) - len(stripped)]
+                if b'  ' not in stripped:
+                    normalized_lines.append(line)
+                    continue
 
                 # Normalize multiple spaces to single space in content
                 # But preserve spaces inside quoted strings
-                if '"' not in stripped and "'" not in stripped:
-                    # No quotes - safe to normalize
-                    normalized = re.sub(r' {2,}', ' ', stripped)
-                else:
-                    # Has quotes - only normalize outside of quoted regions
-                    # Simple approach: don't normalize to avoid breaking strings
-                    normalized = stripped
+                # Simple approach: don't normalize lines with quotes to avoid
+                # breaking strings
+                if b'"' not in stripped and b"'" not in stripped:
+                    # Preserve leading whitespace (indentation)
+                    indent = len(line) - len(stripped)
+                    line = line[:indent] + MULTISPACE_PATTERN.sub(b' ', stripped)
 
-                normalized_lines.append(leading_ws + normalized)
+                normalized_lines.append(line)
 
-            content = '\n'.join(normalized_lines)
+            content = b'\n'.join(normalized_lines)
 
         if changes_made and not dry_run:
-            filepath.write_text(content, encoding='utf-8')
-            return True
+            filepath.write_bytes(content)
 
-        return changes_made
+        return changes_made, messages
 
     except Exception as e:
-        log_error(f"Error processing {filepath}: {e}")
-        return False
+        messages.append((True, format_error(f"Error processing {filepath}: {e}")))
+        return False, messages
+
+
+def _walk(base: str, suffixes: Tuple[str, ...], recursive: bool) -> Iterator[str]:
+    """Yield paths of files under base whose names end with one of suffixes"""
+    # One directory read per level for all types; names are visited in order
+    with os.scandir(base) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from _walk(entry.path, suffixes, recursive)
+        elif entry.name.endswith(suffixes) and entry.is_file():
+            yield entry.path
 
 
 def main():
@@ -257,20 +237,21 @@ Examples:
     # Determine base path
     base_path = Path(args.path)
 
-    if not base_path.exists():
+    # One stat answers exists, is-file and is-dir
+    try:
+        st_mode = os.stat(base_path).st_mode
+    except OSError:
         log_error(f"Path not found: {base_path}")
         return 1
 
     # Determine which files to process
     files = []
 
-    if base_path.is_file():
+    if stat.S_ISREG(st_mode):
         files.append(base_path)
-    elif base_path.is_dir():
-        for ext in args.types:
-            ext = ext.lstrip('*.')
-            pattern = f'**/*.{ext}' if args.recursive else f'*.{ext}'
-            files.extend(base_path.glob(pattern))
+    elif stat.S_ISDIR(st_mode):
+        suffixes = tuple('.' + ext.lstrip('*.') for ext in args.types)
+        files.extend(Path(path) for path in _walk(str(base_path), suffixes, args.recursive))
     else:
         log_error(f"Invalid path: {base_path}")
         return 1
@@ -292,18 +273,24 @@ Examples:
     total_files = 0
     fixed_files = 0
 
-    for filepath in sorted(files):
-        if not filepath.exists():
-            log_error(f"File not found: {filepath}")
-            continue
-
-        if not filepath.is_file():
-            log_error(f"Not a file: {filepath}")
-            continue
+    # Every path was just stat'ed as a regular file, so none is checked
+    # again; one that vanishes since is reported by fix_icons_in_file.
+    # Files are independent and the regex work is CPU-bound, so large
+    # sweeps are spread over processes; results come back in file order
+    if len(files) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(fix_icons_in_file, files,
+                                        repeat(args.dry_run), chunksize=8))
+    else:
+        results = [fix_icons_in_file(filepath, args.dry_run) for filepath in files]
 
+    for filepath, (changed, messages) in zip(files, results):
         total_files += 1
 
-        if fix_icons_in_file(filepath, dry_run=args.dry_run):
+        for is_error, message in messages:
+            print(message, file=sys.stderr if is_error else sys.stdout)
+
+        if changed:
             fixed_files += 1
         else:
             print(f"  {Colors.TEXT}{filepath.name}{Colors.NC} {Colors.SUBTEXT}(no changes needed){Colors.NC}")
@@ -4,10 +4,13 @@ Remove Unicode Emojis from Files
 Removes Unicode emoji characters while preserving Nerd Font icons
 """
 
+import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 # Add sys/theme to path for central theming
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -15,7 +18,7 @@ REPO_ROOT = SCRIPT_DIR.parent.parent
 sys.path.insert(0, str(REPO_ROOT / 'sys' / 'theme'))
 
 # Import central theme
-from theme import Colors, Icons, log_success, log_error, log_warn, log_info
+from theme import Colors, Icons, log_success, log_error, log_warn, log_info, parse_env_file
 
 
 def load_env_config(repo_root: Path) -> dict:
@@ -25,15 +28,11 @@ def load_env_config(repo_root: Path) -> dict:
     if not env_file.exists():
         raise FileNotFoundError(f"config not found: {env_file}")
 
-    config = {}
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                config[key] = value
+    # Remove quotes if present
+    config = {
+        key: value.strip('"').strip("'")
+        for key, value in parse_env_file(env_file).items()
+    }
 
     return config
 
@@ -41,6 +40,37 @@ def load_env_config(repo_root: Path) -> dict:
 # Use central theme icons
 CLEAN = Icons.CLEAN
 
+# Emoji ranges to remove (ONLY chat emojis from emojidb.org), compiled once
+# Preserves Nerd Font icons (U+E000-U+F8FF, U+F0000-U+FFFFD)
+# Preserves Box-Drawing characters (U+2500-U+257F)
+# Preserves standard punctuation and technical symbols
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0000200D"             # Zero Width Joiner
+    "\U0000FE00-\U0000FE0F"  # Variation Selectors
+    "\U0001F1E6-\U0001F1FF"  # Regional Indicators (flags 🇩🇪🇺🇸)
+    # Emoji & Pictographs (😀🎉🚀 etc.), which already spans Supplemental
+    # Symbols and Pictographs (U+1F900-U+1F9FF) and Extended Pictographs
+    # (U+1FA70-U+1FAF8), so those are not listed again
+    "\U0001F300-\U0001FAF8"
+    "]+",
+    flags=re.UNICODE
+)
+
+# UTF-8 prefixes of every character EMOJI_PATTERN can match: U+1F000-U+1FFFF
+# start with F0 9F, U+FE00-U+FE0F with EF B8, and ZWJ is E2 80 8D
+EMOJI_UTF8_PREFIXES = (b'\xf0\x9f', b'\xef\xb8', b'\xe2\x80\x8d')
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Files never processed: exact names are a set lookup, globs are matched
+EXCLUDE_NAMES = frozenset({
+    'remove_emojis.py',      # Don't modify self
+    'fix_nerdfonts.py',      # Don't modify nerd font fixer
+})
+EXCLUDE_GLOBS = ()
+
 
 def remove_emojis(text: str) -> str:
     """
@@ -55,22 +85,6 @@ def remove_emojis(text: str) -> str:
     Returns:
         Text with emojis removed and whitespace normalized
     """
-    # Emoji ranges to remove (ONLY chat emojis from emojidb.org)
-    # Preserves Nerd Font icons (U+E000-U+F8FF, U+F0000-U+FFFFD)
-    # Preserves Box-Drawing characters (U+2500-U+257F)
-    # Preserves standard punctuation and technical symbols
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F300-\U0001FAF8"  # Emoji & Pictographs (😀🎉🚀 etc.)
-        "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-        "\U0001FA70-\U0001FAF8"  # Extended Pictographs
-        "\U0001F1E6-\U0001F1FF"  # Regional Indicators (flags 🇩🇪🇺🇸)
-        "\U0000FE00-\U0000FE0F"  # Variation Selectors
-        "\U0000200D"             # Zero Width Joiner
-        "]+",
-        flags=re.UNICODE
-    )
-
     # Remove emojis and normalize whitespace ONLY where emojis were removed
     # This preserves intentional spacing like in tree structures (├──)
     def replace_and_normalize(match):
@@ -89,9 +103,9 @@ def remove_emojis(text: str) -> str:
         # Otherwise just remove the emoji
         return ''
 
-    return emoji_pattern.sub(replace_and_normalize, text)
+    return EMOJI_PATTERN.sub(replace_and_normalize, text)
 
-def remove_emojis_from_file(filepath: Path, keep_backup: bool = True) -> Tuple[bool, int]:
+def remove_emojis_from_file(filepath: Path, keep_backup: bool = True) -> Tuple[bool, int, Optional[str]]:
     """
     Remove emojis from a file
 
@@ -100,35 +114,53 @@ def remove_emojis_from_file(filepath: Path, keep_backup: bool = True) -> Tuple[b
         keep_backup: Whether to keep backup file
 
     Returns:
-        Tuple of (changed, emoji_count)
+        Tuple of (changed, emoji_count, error message or None); errors are
+        returned rather than logged so worker processes stay quiet
     """
     try:
-        # Read file
-        original_content = filepath.read_text(encoding='utf-8')
+        # Read file; bytes without any emoji prefix need no decoding at all
+        data = filepath.read_bytes()
+        if not any(prefix in data for prefix in EMOJI_UTF8_PREFIXES):
+            return False, 0, None
+
+        # Decode with universal newlines, as read_text() would
+        original_content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
 
         # Remove emojis
         new_content = remove_emojis(original_content)
 
         # Check if changed
         if original_content == new_content:
-            return False, 0
+            return False, 0, None
 
         # Count removed emojis (approximate)
         emoji_count = len(original_content) - len(new_content)
 
-        # Create backup if requested
+        # Create backup if requested, from the bytes already read
         if keep_backup:
             backup_path = filepath.with_suffix(filepath.suffix + '.emoji-backup')
-            backup_path.write_text(original_content, encoding='utf-8')
+            backup_path.write_bytes(data)
 
         # Write cleaned content
         filepath.write_text(new_content, encoding='utf-8')
 
-        return True, emoji_count
+        return True, emoji_count, None
 
     except Exception as e:
-        log_error(f"Error processing {filepath.name}: {e}")
-        return False, 0
+        return False, 0, f"Error processing {filepath.name}: {e}"
+
+def _walk(base: str, suffixes: Tuple[str, ...], recursive: bool) -> Iterator[str]:
+    """Yield paths of files under base whose names end with one of suffixes"""
+    # One directory read per level for all types; names are visited in order
+    with os.scandir(base) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from _walk(entry.path, suffixes, recursive)
+        elif entry.name.endswith(suffixes) and entry.is_file():
+            yield entry.path
 
 def main():
     """Main function"""
@@ -197,10 +229,8 @@ Examples:
     if base_path.is_file():
         files.append(base_path)
     elif base_path.is_dir():
-        for ext in args.types:
-            ext = ext.lstrip('*.')
-            pattern = f'**/*.{ext}' if args.recursive else f'*.{ext}'
-            files.extend(base_path.glob(pattern))
+        suffixes = tuple('.' + ext.lstrip('*.') for ext in args.types)
+        files.extend(Path(path) for path in _walk(str(base_path), suffixes, args.recursive))
     else:
         log_error(f"Invalid path: {base_path}")
         return 1
@@ -210,31 +240,12 @@ Examples:
         return 1
 
     # Exclude certain files from processing
-    exclude_patterns = [
-        'remove_emojis.py',      # Don't modify self
-        'fix_nerdfonts.py',      # Don't modify nerd font fixer
+    files = [
+        f for f in files
+        if f.name not in EXCLUDE_NAMES
+        and not any(f.match(pattern) for pattern in EXCLUDE_GLOBS)
     ]
 
-    filtered_files = []
-    for f in files:
-        should_exclude = False
-        for pattern in exclude_patterns:
-            if pattern.startswith('*'):
-                # Glob pattern
-                if f.match(pattern):
-                    should_exclude = True
-                    break
-            else:
-                # Exact filename match
-                if f.name == pattern:
-                    should_exclude = True
-                    break
-
-        if not should_exclude:
-            filtered_files.append(f)
-
-    files = filtered_files
-
     if not files:
         log_error(f"No files remaining after exclusions")
         return 1
@@ -254,11 +265,20 @@ Examples:
     total_emojis = 0
     cleaned_files = []  # Track cleaned files
 
-    for filepath in sorted(files):
-        changed, emoji_count = remove_emojis_from_file(
-            filepath,
-            keep_backup=not args.no_backup
-        )
+    # Files are independent and the regex work is CPU-bound, so large
+    # sweeps are spread over processes; results come back in file order
+    files = sorted(files)
+    keep_backup = not args.no_backup
+    if len(files) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(remove_emojis_from_file, files,
+                                        repeat(keep_backup), chunksize=8))
+    else:
+        results = [remove_emojis_from_file(filepath, keep_backup) for filepath in files]
+
+    for filepath, (changed, emoji_count, error) in zip(files, results):
+        if error:
+            log_error(error)
 
         if changed:
             cleaned_count += 1